@@ -10,17 +10,9 @@ __author__ = "ElementFinder Development Team"
 __email__ = "dev@elementfinder.local"
 __license__ = "MIT"
 
-# パッケージレベルで使用する主要な例外をエクスポート
-from .utils.exceptions import (
-    ElementFinderError,
-    WindowNotFoundError,
-    AnchorNotFoundError,
-    CursorError,
-    NoElementsFoundError,
-    InvalidArgumentError,
-)
+import importlib
 
-__all__ = [
+__all__ = (
     "__version__",
     "__author__", 
     "__email__",
@@ -31,4 +23,30 @@ __all__ = [
     "CursorError",
     "NoElementsFoundError",
     "InvalidArgumentError",
-]
+)
+
+# パッケージレベルで使用する主要な例外をエクスポート（初回アクセス時に遅延インポート）
+_LAZY_ATTRS = {
+    "ElementFinderError": "utils.exceptions",
+    "WindowNotFoundError": "utils.exceptions",
+    "AnchorNotFoundError": "utils.exceptions",
+    "CursorError": "utils.exceptions",
+    "NoElementsFoundError": "utils.exceptions",
+    "InvalidArgumentError": "utils.exceptions",
+}
+
+
+def __getattr__(name):
+    """公開名への初回アクセス時にサブモジュールをインポートします"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
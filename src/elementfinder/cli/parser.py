@@ -2,11 +2,14 @@
 ElementFinder コマンドライン引数解析
 
 要件定義書に基づく完全なコマンドライン引数の解析を提供します。
+argparseは起動コストが大きいため、静的なオプション表を一度走査するだけの
+軽量なパーサーで実装しています。
 """
 
-import argparse
 import sys
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Final
 
 from ..utils.exceptions import InvalidArgumentError
 from ..utils.validators import (
@@ -18,26 +21,198 @@ from ..utils.validators import (
 from .. import __version__
 
 
-class ElementFinderArgumentParser:
+_PROG: Final[str] = 'uiaf'
+
+# 値を取らないフラグ（オプション文字列 -> 格納先キー）
+_FLAG_OPTIONS = {
+    '--title-re': 'title_re',
+    '-c': 'cursor',
+    '--cursor': 'cursor',
+    '--cursor-delay-strict': 'cursor_delay_strict',
+    '--parent': 'parent',
+    '--json': 'json',
+    '--pywinauto-native': 'pywinauto_native',
+    '--show-rectangle': 'show_rectangle',
+    '--only-visible': 'only_visible',
+    '--verbose': 'verbose',
+}
+
+# 値を取るオプション（オプション文字列 -> 格納先キー）
+# 値の検証は _validate_arguments でまとめて行う
+_VALUE_OPTIONS = {
+    '--backend': 'backend',
+    '--depth': 'depth',
+    '--timeout': 'timeout',
+    '--anchor-control-type': 'anchor_control_type',
+    '--anchor-title': 'anchor_title',
+    '--anchor-name': 'anchor_name',
+    '--anchor-class-name': 'anchor_class_name',
+    '--anchor-auto-id': 'anchor_auto_id',
+    '--anchor-found-index': 'anchor_found_index',
+    '--cursor-delay': 'cursor_delay',
+    '--fields': 'fields',
+    '--max-items': 'max_items',
+}
+
+# 値が固定の選択肢に限られるオプション（格納先キー -> 選択肢）
+_CHOICES = {
+    'backend': ('win32', 'uia'),
+}
+
+# 前方一致による省略形の解決対象となる長いオプション
+_LONG_OPTIONS = tuple(
+    option for option in (*_FLAG_OPTIONS, *_VALUE_OPTIONS, '--help', '--version')
+    if option.startswith('--')
+)
+
+# アンカー条件（引数キー -> 正規化済み条件キー）
+# ハイフンを含むキーはコンパイラに自動interningされないため明示的にinternする
+_ANCHOR_KEYS = (
+    ('anchor_control_type', sys.intern('control-type')),
+    ('anchor_title', 'title'),
+    ('anchor_name', 'name'),
+    ('anchor_class_name', sys.intern('class-name')),
+    ('anchor_auto_id', sys.intern('auto-id')),
+)
+
+# 検証対象の値付きオプション（入力キー, 出力キー, バリデータ, 未指定時の値）
+_FIELD_SPEC = (
+    ('backend', 'backend', validate_backend, None),
+    ('depth', 'depth', validate_depth, None),
+    ('timeout', 'timeout', validate_timeout, None),
+    ('anchor_found_index', 'anchor_found_index', validate_found_index, None),
+    ('cursor_delay', 'cursor_delay', validate_cursor_delay, None),
+    ('fields', 'fields', validate_fields, None),
+    ('max_items', 'max_items', validate_max_items, None),
+)
+
+# 空文字の指定を未指定として扱う値付きオプション（既定値を持たないもの）
+_EMPTY_AS_UNSET_KEYS = frozenset(('fields', 'max_items'))
+
+# 検証せずにそのまま引き継ぐフラグ
+_PASSTHROUGH_KEYS = (
+    'cursor', 'cursor_delay_strict', 'parent', 'json', 'pywinauto_native',
+    'show_rectangle', 'only_visible', 'verbose',
+)
+
+# 相互排他的なオプショングループ
+_EXCLUSIVE_GROUPS = (
+    ('json', 'pywinauto_native'),  # 出力形式は一つだけ選択可能
+)
+
+# 解析前の既定値
+_DEFAULTS = {
+    'window_title': None,
+    'title_re': False,
+    'backend': 'uia',
+    'depth': '3',
+    'timeout': '5',
+    'anchor_control_type': None,
+    'anchor_title': None,
+    'anchor_name': None,
+    'anchor_class_name': None,
+    'anchor_auto_id': None,
+    'anchor_found_index': '0',
+    'cursor': False,
+    'cursor_delay': '5',
+    'cursor_delay_strict': False,
+    'parent': False,
+    'json': False,
+    'fields': None,
+    'pywinauto_native': False,
+    'max_items': None,
+    'show_rectangle': False,
+    'only_visible': False,
+    'verbose': False,
+}
+
+
+def _is_negative_number(token: str) -> bool:
     """
-    ElementFinder専用のコマンドライン引数解析クラス
+    トークンが負の数値（オプションではなく値）かどうかを判定します
+    
+    Args:
+        token: 判定するトークン
+    
+    Returns:
+        bool: 負の数値の場合True
+    """
+    return token[1:].replace('.', '', 1).isdigit()
+
+
+# Python 3.9 でも使えるよう dataclass(slots=True) ではなく __slots__ を明示する
+@dataclass
+class _RawArgs:
     """
+    トークン解析直後の未検証引数（_DEFAULTS と同じフィールドを持つ）
+    """
+    __slots__ = tuple(_DEFAULTS)
     
-    def __init__(self):
-        self.parser = self._create_parser()
+    window_title: Optional[str]
+    title_re: bool
+    backend: str
+    depth: str
+    timeout: str
+    anchor_control_type: Optional[str]
+    anchor_title: Optional[str]
+    anchor_name: Optional[str]
+    anchor_class_name: Optional[str]
+    anchor_auto_id: Optional[str]
+    anchor_found_index: str
+    cursor: bool
+    cursor_delay: str
+    cursor_delay_strict: bool
+    parent: bool
+    json: bool
+    fields: Optional[str]
+    pywinauto_native: bool
+    max_items: Optional[str]
+    show_rectangle: bool
+    only_visible: bool
+    verbose: bool
     
-    def _create_parser(self) -> argparse.ArgumentParser:
+    def get(self, key: str, default: Any = None) -> Any:
         """
-        argparseパーサーを作成します
-        
-        Returns:
-            設定済みのArgumentParserインスタンス
+        辞書互換の取得メソッド（validators の組み合わせチェック用）
         """
-        parser = argparse.ArgumentParser(
-            prog='uiaf',
-            description='GUIアプリケーションの要素特定を効率化するCLIツール',
-            epilog='''
-使用例:
+        return getattr(self, key, default)
+
+
+@dataclass
+class ValidatedArgs:
+    """
+    検証・正規化済みのコマンドライン引数
+    """
+    __slots__ = (
+        'window_title', 'title_re', 'backend', 'depth', 'timeout',
+        'anchor_found_index', 'cursor_delay', 'fields', 'max_items',
+        'anchor_conditions', 'cursor', 'cursor_delay_strict', 'parent', 'json',
+        'pywinauto_native', 'show_rectangle', 'only_visible', 'verbose',
+    )
+    
+    window_title: Optional[str]
+    title_re: bool
+    backend: str
+    depth: Optional[int]
+    timeout: int
+    anchor_found_index: int
+    cursor_delay: float
+    fields: Optional[List[str]]
+    max_items: Optional[int]
+    anchor_conditions: Dict[str, str]
+    cursor: bool
+    cursor_delay_strict: bool
+    parent: bool
+    json: bool
+    pywinauto_native: bool
+    show_rectangle: bool
+    only_visible: bool
+    verbose: bool
+
+
+_DESCRIPTION: Final[str] = 'GUIアプリケーションの要素特定を効率化するCLIツール'
+
+_EPILOG: Final[str] = '''使用例:
   # 設定ウィンドウのPane要素をアンカーに、3階層まで取得（UIA）
   uiaf "アプリ - 設定" --backend uia --anchor-control-type Pane --depth 3
   
@@ -49,187 +224,213 @@ class ElementFinderArgumentParser:
   
   # 複数マッチ時の2番目を選択
   uiaf "アプリ" --anchor-title "詳細" --anchor-found-index 1
-            ''',
-            formatter_class=argparse.RawDescriptionHelpFormatter
-        )
-        
-        # 位置引数（--cursor指定時はオプション）
-        parser.add_argument(
-            'window_title',
-            nargs='?',  # オプション引数に変更
-            help='ウィンドウタイトル（完全一致、--title-reで正規表現可、--cursor指定時は不要）'
-        )
-        
-        # オプション引数
-        self._add_basic_options(parser)
-        self._add_anchor_options(parser)
-        self._add_cursor_options(parser)
-        self._add_output_options(parser)
-        self._add_filter_options(parser)
-        self._add_misc_options(parser)
-        
-        return parser
-    
-    def _add_basic_options(self, parser: argparse.ArgumentParser) -> None:
-        """基本オプションを追加"""
-        
-        parser.add_argument(
-            '--title-re',
-            action='store_true',
-            help='ウィンドウタイトルを正規表現として扱う'
-        )
-        
-        parser.add_argument(
-            '--backend',
-            choices=['win32', 'uia'],
-            default='uia',
-            help='使用するバックエンド（既定: uia）'
-        )
-        
-        parser.add_argument(
-            '--depth',
-            type=str,
-            default='3',
-            help='取得する階層の深さ（0以上の整数 または "max", 既定: 3）'
-        )
-        
-        parser.add_argument(
-            '--timeout',
-            type=str,
-            default='5',
-            help='ウィンドウ待機タイムアウト秒数（既定: 5）'
-        )
-    
-    def _add_anchor_options(self, parser: argparse.ArgumentParser) -> None:
-        """アンカー関連オプションを追加"""
-        
-        anchor_group = parser.add_argument_group('アンカー指定', 'アンカー要素を特定するためのオプション')
-        
-        anchor_group.add_argument(
-            '--anchor-control-type',
-            help='アンカーのcontrol_type（UIA用）'
-        )
-        
-        anchor_group.add_argument(
-            '--anchor-title',
-            help='アンカーのタイトル'
-        )
-        
-        anchor_group.add_argument(
-            '--anchor-name',
-            help='アンカーの名前'
-        )
-        
-        anchor_group.add_argument(
-            '--anchor-class-name',
-            help='アンカーのクラス名'
-        )
-        
-        anchor_group.add_argument(
-            '--anchor-auto-id',
-            help='アンカーの自動ID'
-        )
-        
-        anchor_group.add_argument(
-            '--anchor-found-index',
-            type=str,
-            default='0',
-            help='アンカーの複数マッチ時の選択インデックス（既定: 0）'
-        )
-    
-    def _add_cursor_options(self, parser: argparse.ArgumentParser) -> None:
-        """カーソル関連オプションを追加"""
-        
-        cursor_group = parser.add_argument_group('カーソル指定', 'マウスカーソル位置をアンカーにするオプション')
-        
-        cursor_group.add_argument(
-            '-c', '--cursor',
-            action='store_true',
-            help='マウスカーソル下の要素をアンカーとして使用'
-        )
-        
-        cursor_group.add_argument(
-            '--cursor-delay',
-            type=str,
-            default='5',
-            help='カーソル位置取得までの遅延時間（秒, 既定: 5）'
-        )
-        
-        cursor_group.add_argument(
-            '--parent',
-            action='store_true',
-            help='カーソル下の要素の親要素をアンカーとして使用'
-        )
+'''
+
+# オプショングループの説明
+_ANCHOR_GROUP_DESCRIPTION: Final[str] = 'アンカー要素を特定するためのオプション'
+_CURSOR_GROUP_DESCRIPTION: Final[str] = 'マウスカーソル位置をアンカーにするオプション'
+_OUTPUT_GROUP_DESCRIPTION: Final[str] = '出力形式と内容を制御するオプション'
+_FILTER_GROUP_DESCRIPTION: Final[str] = '出力要素を絞り込むオプション'
+
+_USAGE: Final[str] = f'''usage: {_PROG} [-h] [--title-re] [--backend {{win32,uia}}] [--depth DEPTH]
+            [--timeout TIMEOUT] [--anchor-control-type ANCHOR_CONTROL_TYPE]
+            [--anchor-title ANCHOR_TITLE] [--anchor-name ANCHOR_NAME]
+            [--anchor-class-name ANCHOR_CLASS_NAME]
+            [--anchor-auto-id ANCHOR_AUTO_ID]
+            [--anchor-found-index ANCHOR_FOUND_INDEX] [-c]
+            [--cursor-delay CURSOR_DELAY] [--cursor-delay-strict]
+            [--parent] [--json]
+            [--fields FIELDS] [--pywinauto-native] [--max-items MAX_ITEMS]
+            [--show-rectangle] [--only-visible] [--verbose] [--version]
+            [window_title]
+'''
+
+# --help の全文（インポート時に一度だけ組み立てる）
+_HELP: Final[str] = f'''{_USAGE}
+{_DESCRIPTION}
+
+positional arguments:
+  window_title          ウィンドウタイトル（完全一致、--title-reで正規表現可、--cursor指定時は不要）
+
+options:
+  -h, --help            show this help message and exit
+  --title-re            ウィンドウタイトルを正規表現として扱う
+  --backend {{win32,uia}}
+                        使用するバックエンド（既定: uia）
+  --depth DEPTH         取得する階層の深さ（0以上の整数 または "max", 既定: 3）
+  --timeout TIMEOUT     ウィンドウ待機タイムアウト秒数（既定: 5）
+  --verbose             詳細ログを出力
+  --version             バージョン情報を表示
+
+アンカー指定:
+  {_ANCHOR_GROUP_DESCRIPTION}
+  
+  --anchor-control-type ANCHOR_CONTROL_TYPE
+                        アンカーのcontrol_type（UIA用）
+  --anchor-title ANCHOR_TITLE
+                        アンカーのタイトル
+  --anchor-name ANCHOR_NAME
+                        アンカーの名前
+  --anchor-class-name ANCHOR_CLASS_NAME
+                        アンカーのクラス名
+  --anchor-auto-id ANCHOR_AUTO_ID
+                        アンカーの自動ID
+  --anchor-found-index ANCHOR_FOUND_INDEX
+                        アンカーの複数マッチ時の選択インデックス（既定: 0）
+
+カーソル指定:
+  {_CURSOR_GROUP_DESCRIPTION}
+  
+  -c, --cursor          マウスカーソル下の要素をアンカーとして使用
+  --cursor-delay CURSOR_DELAY
+                        カーソル位置取得までの最大遅延時間（秒, 既定: 5）
+  --cursor-delay-strict
+                        カーソルが静止しても遅延時間いっぱい待機する
+  --parent              カーソル下の要素の親要素をアンカーとして使用
+
+出力制御:
+  {_OUTPUT_GROUP_DESCRIPTION}
+  
+  --json                JSON形式で出力
+  --fields FIELDS       JSON出力時の出力フィールド（カンマ区切り）
+  --pywinauto-native    pywinautoのprint_control_identifiers()を直接実行
+  --max-items MAX_ITEMS
+                        最大出力件数
+  --show-rectangle      座標情報を表示する
+
+フィルター:
+  {_FILTER_GROUP_DESCRIPTION}
+  
+  --only-visible        可視かつ有効な要素のみ出力
+
+{_EPILOG}'''
+
+_VERSION: Final[str] = f'{_PROG} {__version__}'
+
+
+class ElementFinderArgumentParser:
+    """
+    ElementFinder専用のコマンドライン引数解析クラス
+    """
     
-    def _add_output_options(self, parser: argparse.ArgumentParser) -> None:
-        """出力関連オプションを追加"""
+    def _error(self, message: str) -> None:
+        """
+        使用方法とエラーメッセージを標準エラーに出力して終了します
         
-        output_group = parser.add_argument_group('出力制御', '出力形式と内容を制御するオプション')
+        Args:
+            message: エラーメッセージ
         
-        output_group.add_argument(
-            '--json',
-            action='store_true',
-            help='JSON形式で出力'
-        )
+        Raises:
+            SystemExit: 常に終了コード2で送出
+        """
+        sys.stderr.write(_USAGE)
+        sys.stderr.write(f'{_PROG}: error: {message}\n')
+        raise SystemExit(2)
+    
+    def _resolve_option(self, option: str) -> str:
+        """
+        長いオプションの省略形を一意な前方一致で正式名に解決します
         
-        output_group.add_argument(
-            '--fields',
-            type=str,
-            help='JSON出力時の出力フィールド（カンマ区切り）'
-        )
+        Args:
+            option: 入力されたオプション文字列
         
-
+        Returns:
+            str: 解決したオプション文字列（該当なしの場合は入力のまま）
         
-
+        Raises:
+            SystemExit: 複数のオプションに一致する場合
+        """
+        if not option.startswith('--') or option in _LONG_OPTIONS:
+            return option
         
-        output_group.add_argument(
-            '--pywinauto-native',
-            action='store_true',
-            help='pywinautoのprint_control_identifiers()を直接実行'
-        )
+        matches = [candidate for candidate in _LONG_OPTIONS if candidate.startswith(option)]
+        if len(matches) > 1:
+            self._error(f'ambiguous option: {option} could match {", ".join(matches)}')
+        return matches[0] if matches else option
+    
+    def _parse_tokens(self, args: List[str]) -> _RawArgs:
+        """
+        引数リストを一度だけ走査して未検証の引数を作成します
         
-        output_group.add_argument(
-            '--max-items',
-            type=str,
-            help='最大出力件数'
-        )
+        Args:
+            args: 解析する引数リスト
         
-
+        Returns:
+            _RawArgs: 未検証の引数
         
-        output_group.add_argument(
-            '--show-rectangle',
-            action='store_true',
-            help='座標情報を表示する'
-        )
-    
-    def _add_filter_options(self, parser: argparse.ArgumentParser) -> None:
-        """フィルター関連オプションを追加"""
+        Raises:
+            SystemExit: --help / --version 指定時、または解析エラー時
+        """
+        args_dict = dict(_DEFAULTS)
+        positionals = []
+        unknown = []
+        
+        i = 0
+        count = len(args)
+        while i < count:
+            token = args[i]
+            i += 1
+            
+            # "--" 以降はすべて位置引数
+            if token == '--':
+                positionals.extend(args[i:])
+                break
+            
+            if not token.startswith('-') or token == '-':
+                positionals.append(token)
+                continue
+            
+            # --opt=value 形式
+            option, sep, value = token.partition('=')
+            option = self._resolve_option(option)
+            
+            if option in ('-h', '--help'):
+                sys.stdout.write(_HELP)
+                raise SystemExit(0)
+            
+            if option == '--version':
+                sys.stdout.write(_VERSION + '\n')
+                raise SystemExit(0)
+            
+            dest = _FLAG_OPTIONS.get(option)
+            if dest is not None:
+                if sep:
+                    self._error(f'argument {option}: ignored explicit argument {value!r}')
+                args_dict[dest] = True
+                continue
+            
+            dest = _VALUE_OPTIONS.get(option)
+            if dest is None:
+                unknown.append(token)
+                continue
+            
+            if not sep:
+                # --opt value 形式（負の数値以外のオプション風の値は受け付けない）
+                if i >= count or (args[i].startswith('-') and args[i] != '-'
+                                     and not _is_negative_number(args[i])):
+                    self._error(f'argument {option}: expected one argument')
+                value = args[i]
+                i += 1
+            
+            choices = _CHOICES.get(dest)
+            if choices is not None and value not in choices:
+                self._error(
+                    f'argument {option}: invalid choice: {value!r} '
+                    f'(choose from {", ".join(map(repr, choices))})'
+                )
+            
+            args_dict[dest] = value
         
-        filter_group = parser.add_argument_group('フィルター', '出力要素を絞り込むオプション')
+        if positionals:
+            args_dict['window_title'] = positionals[0]
+            unknown.extend(positionals[1:])
         
-        filter_group.add_argument(
-            '--only-visible',
-            action='store_true',
-            help='可視かつ有効な要素のみ出力'
-        )
-    
-    def _add_misc_options(self, parser: argparse.ArgumentParser) -> None:
-        """その他のオプションを追加"""
-        
-        parser.add_argument(
-            '--verbose',
-            action='store_true',
-            help='詳細ログを出力'
-        )
-        
-        parser.add_argument(
-            '--version',
-            action='version',
-            version=f'%(prog)s {__version__}',
-            help='バージョン情報を表示'
-        )
+        if unknown:
+            self._error(f'unrecognized arguments: {" ".join(unknown)}')
+        
+        return _RawArgs(**args_dict)
     
-    def parse_args(self, args: Optional[list] = None) -> Dict[str, Any]:
+    def parse_args(self, args: Optional[list] = None) -> ValidatedArgs:
         """
         コマンドライン引数を解析し、バリデーションを実行します
         
@@ -237,7 +438,7 @@ class ElementFinderArgumentParser:
             args: 解析する引数リスト（テスト用、Noneの場合はsys.argvを使用）
         
         Returns:
-            Dict[str, Any]: 解析・検証済みの引数辞書
+            ValidatedArgs: 解析・検証済みの引数
         
         Raises:
             InvalidArgumentError: 引数が無効な場合
@@ -247,29 +448,22 @@ class ElementFinderArgumentParser:
         if args is None:
             args = sys.argv[1:]
         
-        try:
-            parsed_args = self.parser.parse_args(args)
-        except SystemExit as e:
-            # --help や --version、引数エラー時
-            raise e
-        
-        # 引数辞書に変換
-        args_dict = vars(parsed_args)
+        raw_args = self._parse_tokens(args)
         
         # カスタムバリデーション実行
-        validated_args = self._validate_arguments(args_dict)
+        validated_args = self._validate_arguments(raw_args)
         
         return validated_args
     
-    def _validate_arguments(self, args_dict: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_arguments(self, raw: _RawArgs) -> ValidatedArgs:
         """
         解析済み引数の詳細バリデーションを実行します
         
         Args:
-            args_dict: 解析済み引数辞書
+            raw: 解析済み（未検証）引数
         
         Returns:
-            Dict[str, Any]: 検証・正規化済み引数辞書
+            ValidatedArgs: 検証・正規化済み引数
         
         Raises:
             InvalidArgumentError: バリデーションエラー
@@ -277,105 +471,73 @@ class ElementFinderArgumentParser:
         validated = {}
         
         # ウィンドウタイトル（--cursor指定時は不要）
-        if args_dict['cursor'] and not args_dict['window_title']:
+        if raw.cursor and not raw.window_title:
             # --cursor指定時はwindow_titleが未指定でもOK
             validated['window_title'] = None
             validated['title_re'] = False
         else:
             # window_titleが必須の場合
-            if not args_dict['window_title']:
+            if not raw.window_title:
                 raise InvalidArgumentError(
                     'window_title',
                     'required when not using --cursor',
                     '--cursorを指定しない場合はウィンドウタイトルが必須です'
                 )
             validated['window_title'] = validate_window_title(
-                args_dict['window_title'], 
-                args_dict['title_re']
+                raw.window_title,
+                raw.title_re
             )
-            validated['title_re'] = args_dict['title_re']
+            validated['title_re'] = raw.title_re
         
-        # バックエンド
-        validated['backend'] = validate_backend(args_dict['backend'])
-        
-        # 深度
-        validated['depth'] = validate_depth(args_dict['depth'])
-        
-        # タイムアウト
-        validated['timeout'] = validate_timeout(args_dict['timeout'])
+        # 値付きオプション（未指定の場合は既定値のまま、バリデータを呼ばない）
+        for input_key, output_key, validator, default in _FIELD_SPEC:
+            value = getattr(raw, input_key)
+            if value is None or (value == '' and input_key in _EMPTY_AS_UNSET_KEYS):
+                validated[output_key] = default
+            else:
+                validated[output_key] = validator(value)
         
         # アンカー関連
         anchor_conditions = {}
-        for anchor_key in ['anchor_control_type', 'anchor_title', 'anchor_name', 
-                          'anchor_class_name', 'anchor_auto_id']:
-            value = args_dict.get(anchor_key)
+        for arg_key, key_name in _ANCHOR_KEYS:
+            value = getattr(raw, arg_key)
             if value:
-                # キー名を正規化（anchor_control_type -> control_type）
-                key_name = anchor_key.replace('anchor_', '').replace('_', '-')
                 anchor_conditions[key_name] = validate_anchor_value(value, key_name)
         
         validated['anchor_conditions'] = anchor_conditions
-        validated['anchor_found_index'] = validate_found_index(args_dict['anchor_found_index'])
-        
-        # カーソル関連
-        validated['cursor'] = args_dict['cursor']
-        validated['cursor_delay'] = validate_cursor_delay(args_dict['cursor_delay'])
-        validated['parent'] = args_dict.get('parent', False)
-        
-        # 出力関連
-        validated['json'] = args_dict['json']
-        
-        if args_dict.get('fields'):
-            validated['fields'] = validate_fields(args_dict['fields'])
-        else:
-            validated['fields'] = None
         
-
-        validated['pywinauto_native'] = args_dict['pywinauto_native']
-        
-        if args_dict.get('max_items'):
-            validated['max_items'] = validate_max_items(args_dict['max_items'])
-        else:
-            validated['max_items'] = None
-        
-
-        validated['show_rectangle'] = args_dict.get('show_rectangle', False)
-        
-        # フィルター関連
-        validated['only_visible'] = args_dict['only_visible']
-        
-        # その他
-        validated['verbose'] = args_dict['verbose']
+        # フラグ類はそのまま引き継ぐ
+        for key in _PASSTHROUGH_KEYS:
+            validated[key] = getattr(raw, key)
         
         # 相互排他的オプションのチェック
-        exclusive_groups = [
-            ['json', 'pywinauto_native']  # 出力形式は一つだけ選択可能
-        ]
-        validate_mutually_exclusive_options(args_dict, exclusive_groups)
+        validate_mutually_exclusive_options(raw, _EXCLUSIVE_GROUPS)
         
         # 必須組み合わせのチェック
         combinations = [
             # 現在の要件では特になし（cursorとcursor-delayは独立）
         ]
-        validate_required_combinations(args_dict, combinations)
+        validate_required_combinations(raw, combinations)
+        
+        result = ValidatedArgs(**validated)
         
         # 論理的妥当性のチェック
-        self._validate_logical_consistency(validated)
+        self._validate_logical_consistency(result)
         
-        return validated
+        return result
     
-    def _validate_logical_consistency(self, args: Dict[str, Any]) -> None:
+    def _validate_logical_consistency(self, args: ValidatedArgs) -> None:
         """
         引数の論理的整合性をチェックします
         
         Args:
-            args: 検証済み引数辞書
+            args: 検証済み引数
         
         Raises:
             InvalidArgumentError: 論理的に矛盾する引数の組み合わせ
         """
         # JSONオプションとfieldsの組み合わせ
-        if args['fields'] and not args['json']:
+        if args.fields and not args.json:
             raise InvalidArgumentError(
                 'fields',
                 'specified without --json',
@@ -383,35 +545,49 @@ class ElementFinderArgumentParser:
             )
         
         # cursorとanchor条件の重複警告（エラーではない）
-        if args['cursor'] and args['anchor_conditions']:
+        if args.cursor and args.anchor_conditions:
             # 要件では「cursor が優先」と明記されているため、エラーではない
             pass
         
         # parentオプションはcursorと併用する必要がある
-        if args['parent'] and not args['cursor']:
+        if args.parent and not args.cursor:
             raise InvalidArgumentError(
                 'parent',
                 'specified without --cursor',
                 '--parentは--cursorと併用してください'
             )
         
+        # titleとnameはpywinautoの同じ検索条件に対応するため、異なる値は指定できない
+        # （--cursor指定時はアンカー条件を使用しないため対象外）
+        title = args.anchor_conditions.get('title')
+        name = args.anchor_conditions.get('name')
+        if not args.cursor and title is not None and name is not None and title != name:
+            raise InvalidArgumentError(
+                'anchor-name',
+                name,
+                f'--anchor-title と同じ値（{title}）または未指定'
+            )
+        
         # アンカー条件が一つも指定されていない場合の確認
-        if not args['cursor'] and not args['anchor_conditions']:
+        if not args.cursor and not args.anchor_conditions:
             # これは有効（ウィンドウ全体が対象になる）
             pass
 
 
+@lru_cache(maxsize=1)
 def create_parser() -> ElementFinderArgumentParser:
     """
     ElementFinderの引数パーサーを作成します
     
+    パーサーは状態を持たないため、同一プロセス内では同じインスタンスを再利用します。
+    
     Returns:
         ElementFinderArgumentParserインスタンス
     """
     return ElementFinderArgumentParser()
 
 
-def parse_command_line(args: Optional[list] = None) -> Dict[str, Any]:
+def parse_command_line(args: Optional[list] = None) -> ValidatedArgs:
     """
     コマンドライン引数を解析します（便利関数）
     
@@ -419,7 +595,7 @@ def parse_command_line(args: Optional[list] = None) -> Dict[str, Any]:
         args: 解析する引数リスト（テスト用）
     
     Returns:
-        Dict[str, Any]: 解析・検証済み引数辞書
+        ValidatedArgs: 解析・検証済み引数
     
     Raises:
         InvalidArgumentError: 引数が無効な場合
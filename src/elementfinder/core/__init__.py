@@ -2,14 +2,41 @@
 ElementFinder コア機能モジュール
 
 ウィンドウ特定、要素検索、アンカー解決などの中核機能を提供します。
+各サブモジュールはpywinautoを読み込むため、属性への初回アクセス時に
+遅延インポートします。
 """
 
-from .window_finder import WindowFinder, create_window_finder
-from .element_finder import ElementFinder, ElementInfo, create_element_finder
-from .cursor_handler import CursorHandler, create_cursor_handler
+import importlib
 
-__all__ = [
+__all__ = (
     'WindowFinder', 'create_window_finder',
     'ElementFinder', 'ElementInfo', 'create_element_finder', 
     'CursorHandler', 'create_cursor_handler'
-]
\ No newline at end of file
+)
+
+# 公開名 -> 定義元サブモジュール
+_LAZY_ATTRS = {
+    'WindowFinder': 'window_finder',
+    'create_window_finder': 'window_finder',
+    'ElementFinder': 'element_finder',
+    'ElementInfo': 'element_finder',
+    'create_element_finder': 'element_finder',
+    'CursorHandler': 'cursor_handler',
+    'create_cursor_handler': 'cursor_handler',
+}
+
+
+def __getattr__(name):
+    """公開名への初回アクセス時にサブモジュールをインポートします"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(f'.{module_name}', __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
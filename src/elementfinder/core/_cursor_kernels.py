@@ -0,0 +1,35 @@
+"""
+ElementFinder カーソル処理用の数値計算カーネル
+
+numbaでJITコンパイルする任意依存のモジュールです。
+numbaが利用できない環境ではインポート時にImportErrorとなるため、
+cursor_handler側で遅延インポートし、NumPyによる実装にフォールバックします。
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def nearest_rect_index(rects, px2, py2):
+    """
+    中心点が基準点に最も近い矩形のインデックスを求めます
+    
+    Args:
+        rects: (N, 4) の整数配列 (left, top, right, bottom)
+        px2: 基準点のX座標を2倍した値
+        py2: 基準点のY座標を2倍した値
+    
+    Returns:
+        tuple: (最近接矩形のインデックス, 中心座標を2倍したスケールでの距離の2乗)
+    """
+    best = 0
+    best_distance_sq = np.int64(1) << 62
+    for i in range(rects.shape[0]):
+        dx = (rects[i, 0] + rects[i, 2]) - px2
+        dy = (rects[i, 1] + rects[i, 3]) - py2
+        distance_sq = dx * dx + dy * dy
+        if distance_sq < best_distance_sq:
+            best_distance_sq = distance_sq
+            best = i
+    return best, best_distance_sq
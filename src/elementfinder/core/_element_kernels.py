@@ -0,0 +1,30 @@
+"""
+ElementFinder 要素検索用の数値計算カーネル
+
+numbaでJITコンパイルする任意依存のモジュールです。
+numbaが利用できない環境ではインポート時にImportErrorとなるため、
+element_finder側で遅延インポートし、NumPyによる実装にフォールバックします。
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def mask_visible(visible, enabled):
+    """
+    可視要素のみの条件を満たす要素のマスクを求めます
+    
+    _should_include_element と同じく、不明（-1）は除外の理由としません。
+    
+    Args:
+        visible: 可視状態の int8 配列（1=真, 0=偽, -1=不明）
+        enabled: 有効状態の int8 配列（1=真, 0=偽, -1=不明）
+    
+    Returns:
+        np.ndarray: 含める要素がTrueのbool配列
+    """
+    mask = np.empty(visible.shape[0], dtype=np.bool_)
+    for i in range(visible.shape[0]):
+        mask[i] = visible[i] != 0 and enabled[i] != 0
+    return mask
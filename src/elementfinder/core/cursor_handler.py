@@ -4,25 +4,306 @@ ElementFinder カーソル位置処理機能
 マウスカーソル位置の要素取得と、アンカー昇格処理を提供します。
 """
 
+from __future__ import annotations
+
+import functools
+import heapq
+import itertools
+import logging
+import math
+import operator
 import time
-from typing import Any, Optional, Union, Dict
-import psutil
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union, Dict
+
+from ..utils.com import co_initialize
+from ..utils.exceptions import CursorError, ElementFinderError
+from ..utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+    from pywinauto.application import WindowSpecification
 
 try:
-    import win32gui
-    import win32process
-    _WIN32GUI_AVAILABLE = True
-except ImportError:
-    _WIN32GUI_AVAILABLE = False
-
-from pywinauto import Desktop
-from pywinauto.application import WindowSpecification
-from pywinauto.controls.hwndwrapper import HwndWrapper
-
-from ..utils.exceptions import (
-    CursorError, PywinautoError, handle_pywinauto_exception
+    from _ctypes import COMError
+except ImportError:  # Windows以外ではCOMErrorが存在しない
+    COMError = OSError
+
+# 要素へのCOM/Win32呼び出しで想定される例外
+# （KeyboardInterrupt等まで握りつぶさないよう、bare exceptは使わない）
+_ELEMENT_ERRORS = (COMError, OSError, AttributeError, RuntimeError, ValueError)
+
+
+# win32gui / win32process の遅延インポート結果（未試行の場合はNone）
+_win32_modules = None
+
+
+def _get_win32_modules() -> tuple[Any, Any]:
+    """
+    win32gui / win32process を初回使用時にインポートします
+    
+    Returns:
+        tuple: (win32gui, win32process)、利用できない場合は (None, None)
+    """
+    global _win32_modules
+    if _win32_modules is None:
+        try:
+            import win32gui
+            import win32process
+            _win32_modules = (win32gui, win32process)
+        except ImportError:
+            _win32_modules = (None, None)
+    return _win32_modules
+
+
+# 最近接要素の探索でNumPyによる一括計算に切り替える候補数
+_NUMPY_THRESHOLD = 64
+
+# numpyの遅延インポート結果（未試行の場合は_NOT_LOADED）
+_NOT_LOADED = object()
+_numpy_module = _NOT_LOADED
+
+
+def _get_numpy() -> Any:
+    """
+    numpyを初回使用時にインポートします（任意依存）
+    
+    Returns:
+        numpyモジュール、利用できない場合はNone
+    """
+    global _numpy_module
+    if _numpy_module is _NOT_LOADED:
+        try:
+            import numpy
+            _numpy_module = numpy
+        except ImportError:
+            _numpy_module = None
+    return _numpy_module
+
+
+# numbaによるJITカーネルの遅延インポート結果（未試行の場合は_NOT_LOADED）
+_kernels_module = _NOT_LOADED
+
+
+def _get_kernels() -> Any:
+    """
+    numbaでJITコンパイルする数値計算カーネルを初回使用時にインポートします（任意依存）
+    
+    Returns:
+        _cursor_kernelsモジュール、numbaが利用できない場合はNone
+    """
+    global _kernels_module
+    if _kernels_module is _NOT_LOADED:
+        try:
+            from . import _cursor_kernels
+            _kernels_module = _cursor_kernels
+        except ImportError:
+            _kernels_module = None
+    return _kernels_module
+
+
+# 子孫要素の矩形スナップショットを再利用する期間（秒）
+_DESCENDANT_CACHE_TTL = 2.0
+
+# カーソル静止判定のポーリング間隔（秒）・連続サンプル数・許容移動量（ピクセル）
+_SETTLE_POLL_INTERVAL = 0.1
+_SETTLE_SAMPLES = 3
+_SETTLE_TOLERANCE = 2
+
+
+def _is_far(pos1: tuple[int, int], pos2: tuple[int, int]) -> bool:
+    """2点が静止判定の許容移動量より離れているかを判定します"""
+    return (abs(pos1[0] - pos2[0]) > _SETTLE_TOLERANCE or
+            abs(pos1[1] - pos2[1]) > _SETTLE_TOLERANCE)
+
+
+# GetAncestorで親ウィンドウ・ルートウィンドウを取得するフラグ
+_GA_PARENT = 1
+_GA_ROOT = 2
+
+# GA_PARENTで親ウィンドウをたどる最大階層数（無限ループ防止）
+_MAX_HWND_DEPTH = 64
+
+# user32の遅延ロード結果（未試行の場合は_NOT_LOADED）
+_user32 = _NOT_LOADED
+
+
+def _get_user32() -> Any:
+    """
+    ctypes経由でuser32を初回使用時にロードします
+    
+    Returns:
+        user32ライブラリ、Windows以外などで利用できない場合はNone
+    """
+    global _user32
+    if _user32 is _NOT_LOADED:
+        try:
+            import ctypes
+            _user32 = ctypes.windll.user32
+        except (ImportError, AttributeError, OSError):
+            _user32 = None
+    return _user32
+
+
+# ログ出力時に取得する属性と表示名
+_PROBED_CAPTIONS = (('window_text', 'テキスト'), ('class_name', 'クラス名'))
+
+# 詳細情報の取得でcheap_only指定時に省略する（COM呼び出しや走査を伴う）項目
+_EXPENSIVE_FIELDS = ('automation_id', 'children_count', 'depth', 'process_name')
+
+# 要素型ごとに有無をキャッシュする属性名（ログ出力・詳細情報取得で参照）
+_PROBED_ATTRIBUTES = (
+    'window_text', 'class_name', 'name', 'control_type', 'element_info',
+    'automation_id', 'friendly_class_name', 'is_visible', 'handle', 'process_id',
 )
-from ..utils.logging import get_logger, log_function_call
+
+
+# 詳細情報として宣言的に取得する属性（メソッドの場合は呼び出した結果を使用）
+_UIA_INFO_ATTRIBUTES = (
+    'window_text', 'name', 'control_type', 'automation_id', 'class_name',
+    'friendly_class_name', 'is_visible', 'handle',
+)
+_WIN32_INFO_ATTRIBUTES = ('window_text', 'class_name', 'is_visible', 'handle')
+
+
+def _safe_call(fn: Callable[..., Any], *args: Any, default: Any = None) -> Any:
+    """
+    関数を呼び出し、要素操作で想定される例外の場合は既定値を返します
+    
+    Args:
+        fn: 呼び出す関数
+        *args: 関数に渡す引数
+        default: 例外時に返す値
+    
+    Returns:
+        関数の戻り値、または既定値
+    """
+    try:
+        return fn(*args)
+    except _ELEMENT_ERRORS:
+        return default
+
+
+def _read_attribute(element: Any, attr_name: str) -> Any:
+    """要素の属性値を取得します（メソッドの場合は呼び出した結果）"""
+    value = getattr(element, attr_name)
+    return value() if callable(value) else value
+
+
+def _build_attribute_getter(element_type: type, attr_name: str) -> Callable[[Any], Any]:
+    """
+    要素型のクラス定義から、属性値を取得する関数を事前に決定します
+    
+    Args:
+        element_type: 要素の型
+        attr_name: 属性名
+    
+    Returns:
+        Callable[[Any], Any]: 要素を受け取り属性値を返す関数
+    """
+    class_attr = getattr(element_type, attr_name, None)
+    if isinstance(class_attr, property):
+        return operator.attrgetter(attr_name)
+    if callable(class_attr):
+        return operator.methodcaller(attr_name)
+    # インスタンス属性など型から判定できない場合は実行時に判定する
+    return functools.partial(_read_attribute, attr_name=attr_name)
+
+
+# 子要素数のフォールバック計数で数える上限
+_CHILD_COUNT_LIMIT = 1024
+
+
+def _count_children(element: Any, use_element_info: bool = True) -> int:
+    """
+    要素の子要素数を取得します
+    
+    children()が失敗した場合はelement_infoの子要素イテレータで数えます。
+    フォールバックは子孫全体を走査しないよう _CHILD_COUNT_LIMIT 件で打ち切ります。
+    
+    Args:
+        element: 対象要素
+        use_element_info: children()が失敗した場合にelement_infoで数えるか
+    
+    Returns:
+        int: 子要素数
+    """
+    try:
+        children = element.children()
+    except _ELEMENT_ERRORS:
+        if not use_element_info:
+            raise
+        return sum(1 for _ in itertools.islice(
+            element.element_info.iter_children(), _CHILD_COUNT_LIMIT
+        ))
+    return len(children) if children else 0
+
+
+def _rect_to_dict(rect: Optional[tuple[int, int, int, int]]) -> Optional[Dict[str, int]]:
+    """矩形タプルを詳細情報の出力形式の辞書に変換します"""
+    if not rect:
+        return None
+    return {
+        'left': rect[0],
+        'top': rect[1],
+        'right': rect[2],
+        'bottom': rect[3],
+        'width': rect[2] - rect[0],
+        'height': rect[3] - rect[1]
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _pid_to_process_name(pid: int) -> Optional[str]:
+    """
+    プロセスIDからプロセス名を取得します（PIDごとにキャッシュ）
+    
+    Args:
+        pid: プロセスID
+    
+    Returns:
+        Optional[str]: プロセス名、取得できない場合はNone
+    """
+    import psutil  # 多数のサブモジュールを読み込むため、初回使用時にインポート
+    
+    try:
+        return psutil.Process(pid).name()
+    except (psutil.Error, OSError, ValueError):
+        return None
+
+
+def _wrap_pywinauto(op_name: str):
+    """
+    pywinauto操作の呼び出しトレースと例外変換をまとめて行うデコレータ
+    
+    log_function_call と handle_pywinauto_exception を重ねる代わりに
+    単一のラッパーで処理し、ElementFinderError 以外の例外は
+    CursorError に変換します。
+    
+    Args:
+        op_name: エラーメッセージに使用する操作名
+    
+    Usage:
+        @_wrap_pywinauto('親要素の取得')
+        def get_parent_element(self, element):
+            ...
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            logger = self.logger
+            logger.debug(f"関数呼び出し開始: {func.__name__}")
+            try:
+                result = func(self, *args, **kwargs)
+            except ElementFinderError:
+                raise
+            except Exception as e:
+                logger.error(f"{op_name}でエラー: {e}")
+                raise CursorError(f"{op_name}に失敗しました: {e}") from e
+            logger.debug(f"関数呼び出し完了: {func.__name__}")
+            return result
+        return wrapper
+    return decorator
 
 
 class CursorHandler:
@@ -30,6 +311,12 @@ class CursorHandler:
     カーソル位置の要素取得とアンカー昇格を担当するクラス
     """
     
+    # 要素の型 -> 利用可能な属性名の集合
+    _capability_cache: Dict[type, frozenset] = {}
+    
+    # (属性一覧, 要素型) ごとの取得関数の一覧
+    _extractor_cache: Dict[tuple[tuple[str, ...], type], tuple[tuple[str, Callable[[Any], Any]], ...]] = {}
+    
     def __init__(self, backend: str = 'uia'):
         """
         Args:
@@ -38,56 +325,120 @@ class CursorHandler:
         self.backend = backend
         self.logger = get_logger()
         
+        # Desktopは生成時にUIA/COMの初期化を伴うため、バックエンドごとに
+        # 初回使用時に一度だけ作成する（作成は呼び出し元のスレッドでのみ行う）
+        self._desktops: Dict[str, Any] = {}
+        
+        # Win32情報の並行取得用ワーカー（初回使用時に作成し、close() で終了する）
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # 子孫要素の矩形スナップショット（ウィンドウハンドル -> (取得時刻, 生のUIA要素, 矩形群)）
+        self._descendant_cache: Dict[int, tuple[float, list, Any]] = {}
+        
+        # 取得済みの要素矩形（id(要素) -> (要素, 矩形)）。get_cursor_element呼び出しごとにクリア
+        self._rect_hints: Dict[int, tuple[Any, Optional[tuple[int, int, int, int]]]] = {}
+        
         # win32guiの利用可能性をチェック
-        if not _WIN32GUI_AVAILABLE:
+        win32gui, _ = _get_win32_modules()
+        if win32gui is None:
             self.logger.warning("win32guiが利用できません。カーソル機能が制限される可能性があります。")
     
-    @log_function_call
-    @handle_pywinauto_exception
+    @_wrap_pywinauto('カーソル位置の要素取得')
     def get_cursor_element(self, 
                           delay: float = 0.0,
-                          target_window: Optional[WindowSpecification] = None) -> Any:
+                          target_window: Optional[WindowSpecification] = None,
+                          strict_delay: bool = False) -> Any:
         """
         マウスカーソル位置の要素を取得します
         
         Args:
-            delay: カーソル位置取得前の遅延時間（秒）
+            delay: カーソル位置取得前の最大遅延時間（秒）
             target_window: 対象ウィンドウ（アンカー昇格用）
+            strict_delay: Trueの場合、カーソルが静止しても遅延時間いっぱい待機する
         
         Returns:
             カーソル下の要素、またはアンカー昇格された要素
         
         Raises:
             CursorError: カーソル位置の要素取得に失敗した場合
-            PywinautoError: pywinauto操作エラー
         """
-        try:
-            # 遅延処理
-            if delay > 0:
-                self.logger.info(f"カーソル位置取得まで{delay}秒待機...")
+        self._rect_hints.clear()
+        
+        # 遅延処理
+        if delay > 0:
+            self.logger.info(f"カーソル位置取得まで{delay}秒待機...")
+            if strict_delay:
                 time.sleep(delay)
+            else:
+                self._wait_for_cursor_settle(delay)
+        
+        # カーソル位置の取得
+        cursor_pos = self._get_cursor_position()
+        self.logger.debug(f"カーソル位置: ({cursor_pos[0]}, {cursor_pos[1]})")
+        
+        # Desktop.from_pointを使用して要素を取得
+        element = self._get_element_at_point(cursor_pos)
+        
+        # アンカー昇格処理
+        if target_window:
+            element, rect = self._promote_to_window_anchor(element, target_window)
+            if rect is not None:
+                # 昇格時に得た矩形は以降のログ出力・詳細情報取得で再利用する
+                self._rect_hints[id(element)] = (element, rect)
+        
+        # 要素の情報をログ出力
+        self._log_wrapper_info(element, 'カーソル要素', cursor_pos)
+        
+        return element
+    
+    def _wait_for_cursor_settle(self, max_wait: float) -> None:
+        """
+        カーソルが移動した後に静止するまで待機します（最大max_wait秒）
+        
+        開始位置から動いたカーソルが一定回数連続してほぼ同じ位置にあれば、
+        ユーザーが対象要素の上で止めたとみなして待機を打ち切ります。
+        カーソルが一度も動かない場合は従来どおりmax_wait秒待機します。
+        
+        Args:
+            max_wait: 最大待機時間（秒）
+        """
+        deadline = time.monotonic() + max_wait
+        
+        try:
+            start_pos = self._get_cursor_position()
+        except CursorError:
+            # 位置が取れない環境では単純に待機する
+            time.sleep(max_wait)
+            return
+        
+        moved = False
+        last_pos = start_pos
+        stable_count = 0
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(_SETTLE_POLL_INTERVAL, remaining))
             
-            # カーソル位置の取得
-            cursor_pos = self._get_cursor_position()
-            self.logger.debug(f"カーソル位置: ({cursor_pos[0]}, {cursor_pos[1]})")
-            
-            # Desktop.from_pointを使用して要素を取得
-            element = self._get_element_at_point(cursor_pos)
-            
-            # アンカー昇格処理
-            if target_window:
-                element = self._promote_to_window_anchor(element, target_window)
-            
-            # 要素の情報をログ出力
-            self._log_element_info(element, cursor_pos)
+            try:
+                pos = self._get_cursor_position()
+            except CursorError:
+                continue
             
-            return element
+            if not moved:
+                moved = _is_far(pos, start_pos)
+                last_pos = pos
+                continue
             
-        except CursorError:
-            raise
-        except Exception as e:
-            self.logger.error(f"カーソル要素取得失敗: {e}")
-            raise CursorError(f"カーソル位置の要素取得に失敗しました: {e}")
+            if _is_far(pos, last_pos):
+                stable_count = 0
+            else:
+                stable_count += 1
+                if stable_count >= _SETTLE_SAMPLES:
+                    self.logger.debug("カーソルの静止を検出したため待機を終了します")
+                    return
+            last_pos = pos
     
     def _get_cursor_position(self) -> tuple[int, int]:
         """
@@ -100,7 +451,8 @@ class CursorHandler:
             CursorError: カーソル位置の取得に失敗した場合
         """
         try:
-            if _WIN32GUI_AVAILABLE:
+            win32gui, _ = _get_win32_modules()
+            if win32gui is not None:
                 # win32guiを使用（推奨）
                 pos = win32gui.GetCursorPos()
                 return pos
@@ -113,6 +465,22 @@ class CursorHandler:
         except Exception as e:
             raise CursorError(f"カーソル位置の取得に失敗しました: {e}")
     
+    def _get_desktop(self, backend: str) -> Any:
+        """
+        バックエンドごとにキャッシュしたDesktopインスタンスを取得します
+        
+        Args:
+            backend: バックエンド名 ('win32' または 'uia')
+        
+        Returns:
+            pywinautoのDesktopインスタンス
+        """
+        desktop = self._desktops.get(backend)
+        if desktop is None:
+            from pywinauto import Desktop
+            desktop = self._desktops[backend] = Desktop(backend=backend)
+        return desktop
+    
     def _get_element_at_point(self, point: tuple[int, int]) -> Any:
         """
         指定した座標の要素を取得します
@@ -127,8 +495,7 @@ class CursorHandler:
             CursorError: 要素の取得に失敗した場合
         """
         try:
-            # Desktopインスタンスを作成
-            desktop = Desktop(backend=self.backend)
+            desktop = self._get_desktop(self.backend)
             
             # from_pointで要素を取得
             element = desktop.from_point(point[0], point[1])
@@ -144,7 +511,7 @@ class CursorHandler:
     
     def _promote_to_window_anchor(self, 
                                  element: Any, 
-                                 target_window: WindowSpecification) -> Any:
+                                 target_window: WindowSpecification) -> tuple[Any, Optional[tuple[int, int, int, int]]]:
         """
         要素を指定ウィンドウ配下のアンカーに昇格させます
         
@@ -153,27 +520,27 @@ class CursorHandler:
             target_window: 対象ウィンドウ
         
         Returns:
-            昇格されたアンカー要素
+            tuple: (昇格されたアンカー要素, 探索時に取得済みの矩形またはNone)
         """
         try:
             # 要素が既に対象ウィンドウ配下にあるかチェック
             if self._is_element_in_window(element, target_window):
                 self.logger.debug("要素は既に対象ウィンドウ配下にあります")
-                return element
+                return element, None
             
             # ウィンドウ配下で最も近い要素を検索
-            promoted_element = self._find_nearest_element_in_window(element, target_window)
+            promoted_element, promoted_rect = self._find_nearest_element_in_window(element, target_window)
             
             if promoted_element:
                 self.logger.info("アンカー昇格に成功しました")
-                return promoted_element
+                return promoted_element, promoted_rect
             else:
                 self.logger.warning("アンカー昇格に失敗。元の要素を使用します")
-                return element
+                return element, None
                 
         except Exception as e:
             self.logger.warning(f"アンカー昇格処理でエラー: {e}。元の要素を使用します")
-            return element
+            return element, None
     
     def _is_element_in_window(self, element: Any, window: WindowSpecification) -> bool:
         """
@@ -186,26 +553,82 @@ class CursorHandler:
         Returns:
             bool: ウィンドウ配下にある場合True
         """
+        # 両方にウィンドウハンドルがあれば、Win32 APIでルートウィンドウを直接比較
+        in_window = self._is_hwnd_in_window(element, window)
+        if in_window is not None:
+            return in_window
+        
+        # ウィンドウのハンドルはループの外で一度だけ取得する
+        # （WindowSpecificationでは属性参照のたびにウィンドウの再解決が走るため）
+        try:
+            window_handle = getattr(window, 'handle', None)
+        except _ELEMENT_ERRORS:
+            return False
+        if window_handle is None:
+            return False
+        
+        # 要素の親をたどってウィンドウを探す
+        current = element
         try:
-            # 要素の親をたどってウィンドウを探す
-            current = element
             for _ in range(20):  # 最大20階層まで
-                try:
-                    parent = current.parent()
-                    if parent and hasattr(parent, 'handle') and hasattr(window, 'handle'):
-                        # ハンドルが同じかチェック
-                        if parent.handle == window.handle:
-                            return True
-                    current = parent
-                except:
+                parent = current.parent()
+                if parent is None:
                     break
+                # ハンドルが同じかチェック
+                if getattr(parent, 'handle', None) == window_handle:
+                    return True
+                current = parent
+        except _ELEMENT_ERRORS:
+            pass
+        return False
+    
+    def _is_hwnd_in_window(self, element: Any, window: Any) -> Optional[bool]:
+        """
+        GetAncestorでウィンドウハンドル同士の親子関係を判定します
+        
+        親要素をたどるCOM呼び出しの代わりに、USER32の呼び出しで
+        要素のルートウィンドウ（GA_ROOT）を比較し、対象ウィンドウが
+        子ウィンドウの場合は親ウィンドウ（GA_PARENT）を順にたどります。
+        
+        Args:
+            element: チェック対象の要素
+            window: 対象ウィンドウ
+        
+        Returns:
+            Optional[bool]: 判定結果、ハンドルで判定できない場合はNone
+        """
+        user32 = _get_user32()
+        if user32 is None:
+            return None
+        
+        try:
+            element_hwnd = getattr(element, 'handle', None)
+            window_hwnd = getattr(window, 'handle', None)
+        except Exception:
+            return None
+        if not element_hwnd or not window_hwnd:
+            return None
+        
+        if user32.GetAncestor(element_hwnd, _GA_ROOT) == window_hwnd:
+            return True
+        
+        # 対象ウィンドウがトップレベルであれば配下にないことが確定する
+        if user32.GetAncestor(window_hwnd, _GA_ROOT) == window_hwnd:
             return False
-        except:
-            return False
+        
+        # 対象ウィンドウが子ウィンドウの場合は、要素から親ウィンドウをたどる
+        hwnd = element_hwnd
+        for _ in range(_MAX_HWND_DEPTH):
+            if hwnd == window_hwnd:
+                return True
+            hwnd = user32.GetAncestor(hwnd, _GA_PARENT)
+            if not hwnd:
+                break
+        return False
     
     def _find_nearest_element_in_window(self, 
                                        cursor_element: Any, 
-                                       window: WindowSpecification) -> Optional[Any]:
+                                       window: WindowSpecification) -> tuple[Optional[Any], Optional[tuple[int, int, int, int]]]:
         """
         ウィンドウ配下でカーソル要素に最も近い要素を見つけます
         
@@ -214,43 +637,304 @@ class CursorHandler:
             window: 対象ウィンドウ
         
         Returns:
-            Optional[Any]: 見つかった要素、またはNone
+            tuple: (見つかった要素またはNone, その要素の矩形またはNone)
         """
         try:
             # カーソル要素の矩形を取得
-            cursor_rect = self._safe_get_rectangle(cursor_element)
+            cursor_rect = self._get_hinted_rectangle(cursor_element)
             if not cursor_rect:
-                return None
+                return None, None
             
-            # ウィンドウの子要素を取得
-            children = window.descendants()
+            # まず矩形が中心点を含む子要素だけをたどる（全子孫の列挙を避ける）
+            center = (
+                (cursor_rect[0] + cursor_rect[2]) / 2,
+                (cursor_rect[1] + cursor_rect[3]) / 2
+            )
+            containing_element, containing_rect = self._descend_to_point(window, center)
+            if containing_element is not None:
+                self.logger.debug("中心点を含む最深要素を発見")
+                return containing_element, containing_rect
+            
+            # フォールバック: 中心点間距離が最小の要素を探す
             best_element = None
-            min_distance = float('inf')
+            best_rect = None
+            min_distance_sq = float('inf')
             
-            for child in children:
-                try:
-                    child_rect = self._safe_get_rectangle(child)
-                    if not child_rect:
-                        continue
-                    
-                    # 距離を計算（矩形の中心点間の距離）
-                    distance = self._calculate_rect_distance(cursor_rect, child_rect)
-                    
-                    if distance < min_distance:
-                        min_distance = distance
-                        best_element = child
-                        
-                except:
-                    continue
+            gathered = self._get_descendant_rectangles(window)
+            if gathered is None:
+                # 矩形の一括取得ができない場合は、近い部分木から順に分枝限定法で探索
+                best_element, best_rect, min_distance_sq = self._search_nearest_branch_and_bound(
+                    window, cursor_rect
+                )
+            else:
+                raw_elements, rects = gathered
+                if raw_elements:
+                    if isinstance(rects, list):
+                        best_index, min_distance_sq = self._nearest_rect_index(cursor_rect, rects)
+                    else:
+                        # 要素数が多い場合はNumPyの配列で一括計算
+                        best_index, min_distance_sq = self._nearest_rect_index_numpy(
+                            _get_numpy(), cursor_rect, rects
+                        )
+                    # ラッパーは最近接の要素に対してのみ作成する
+                    best_element = self._wrap_uia_element(raw_elements[best_index])
+                    best_rect = tuple(int(v) for v in rects[best_index])
             
             if best_element:
-                self.logger.debug(f"最近接要素を発見（距離: {min_distance:.1f}）")
+                # 距離の2乗は中心座標を2倍したスケールのため、平方根を取って半分にする
+                self.logger.debug(f"最近接要素を発見（距離: {math.sqrt(min_distance_sq) / 2:.1f}）")
             
-            return best_element
+            return best_element, best_rect
             
         except Exception as e:
             self.logger.debug(f"最近接要素検索でエラー: {e}")
+            return None, None
+    
+    def _get_descendant_rectangles(self, window: Any) -> Optional[tuple[list, Any]]:
+        """
+        ウィンドウの全子孫要素とその矩形を一括取得します
+        
+        UIAバックエンドではCacheRequestでBoundingRectangleを一括取得し、
+        要素ごとのrectangle()呼び出し（プロセス間通信）を避けます。
+        
+        Args:
+            window: 対象ウィンドウ
+        
+        Returns:
+            Optional[tuple]: (生のUIA要素のリスト, 矩形群)、一括取得できない場合はNone
+            矩形群の形式は _get_cached_uia_rectangles を参照
+        """
+        if self.backend != 'uia':
             return None
+        
+        try:
+            if hasattr(window, 'wrapper_object'):
+                window = window.wrapper_object()
+            handle = getattr(window, 'handle', None)
+            
+            # 同じウィンドウへの短時間の連続問い合わせではスナップショットを再利用
+            now = time.monotonic()
+            cached = self._descendant_cache.get(handle) if handle else None
+            if cached is not None and now - cached[0] < _DESCENDANT_CACHE_TTL:
+                self.logger.debug("子孫要素の矩形スナップショットを再利用")
+                return cached[1], cached[2]
+            
+            raw_elements, rects = self._get_cached_uia_rectangles(window)
+            if handle:
+                self._descendant_cache[handle] = (now, raw_elements, rects)
+            return raw_elements, rects
+        except Exception as e:
+            self.logger.debug(f"UIAキャッシュによる矩形取得に失敗: {e}")
+        return None
+    
+    def invalidate_cache(self) -> None:
+        """
+        子孫要素の矩形スナップショットを破棄します
+        
+        ウィンドウの内容が変化したことが分かっている場合に呼び出します。
+        """
+        self._descendant_cache.clear()
+    
+    def _search_nearest_branch_and_bound(self,
+                                         window: Any,
+                                         rect: tuple[int, int, int, int]) -> tuple[Optional[Any], Optional[tuple[int, int, int, int]], float]:
+        """
+        中心点が基準矩形の中心に最も近い子孫要素を分枝限定法で探索します
+        
+        要素の矩形から基準点までの最短距離を部分木の下限値としてヒープで管理し、
+        下限値の小さい部分木から展開します。下限値が暫定最小距離以上の部分木は
+        展開しないため、全子孫を列挙せずに済みます。
+        子要素は親要素の矩形内に収まっていることを前提とします。
+        
+        Args:
+            window: 探索の起点となるウィンドウ
+            rect: 基準矩形 (left, top, right, bottom)
+        
+        Returns:
+            tuple: (最近接要素またはNone, その要素の矩形またはNone,
+                    中心座標を2倍したスケールでの距離の2乗)
+        """
+        # 中心座標を2倍したスケールで扱い、整数演算のみで比較する
+        px = rect[0] + rect[2]
+        py = rect[1] + rect[3]
+        
+        best_element = None
+        best_rect = None
+        best_distance_sq = float('inf')
+        
+        heap = []
+        counter = itertools.count()  # 下限値が同じ場合の比較用
+        
+        def push_children(parent: Any, parent_bound: int) -> None:
+            try:
+                children = parent.children()
+            except _ELEMENT_ERRORS:
+                return
+            for child in children:
+                child_rect = self._safe_get_rectangle(child)
+                if child_rect is None:
+                    # 矩形が取れない要素は候補にせず、親の下限値で子孫だけ探索する
+                    bound = parent_bound
+                else:
+                    dx = max(2 * child_rect[0] - px, px - 2 * child_rect[2], 0)
+                    dy = max(2 * child_rect[1] - py, py - 2 * child_rect[3], 0)
+                    bound = dx * dx + dy * dy
+                if bound < best_distance_sq:
+                    heapq.heappush(heap, (bound, next(counter), child, child_rect))
+        
+        push_children(window, 0)
+        
+        while heap:
+            bound, _, element, element_rect = heapq.heappop(heap)
+            if bound >= best_distance_sq:
+                # 残りの部分木はすべて暫定最小距離以上
+                break
+            
+            if element_rect is not None:
+                distance_sq = self._calculate_rect_distance_sq(rect, element_rect)
+                if distance_sq < best_distance_sq:
+                    best_distance_sq = distance_sq
+                    best_element = element
+                    best_rect = element_rect
+            
+            push_children(element, bound)
+        
+        return best_element, best_rect, best_distance_sq
+    
+    def _get_cached_uia_rectangles(self, window: Any) -> tuple[list, Any]:
+        """
+        UIAのCacheRequestで全子孫要素の矩形を一度のCOM呼び出しで取得します
+        
+        要素と矩形は別々の列（SoA）として保持します。要素数が
+        _NUMPY_THRESHOLD 以上でNumPyが利用できる場合、矩形は (N, 4) の
+        int64配列へ一度の走査で直接書き込み、要素ごとのタプルを作りません。
+        ラッパーの生成は最近接要素が決まった後に一件だけ行います。
+        
+        Args:
+            window: 対象ウィンドウ（WindowSpecificationまたはラッパー）
+        
+        Returns:
+            tuple: (生のUIA要素のリスト, 矩形群)
+            矩形群は (N, 4) のNumPy配列、または (left, top, right, bottom) のリスト
+        """
+        from pywinauto.uia_defines import IUIA
+        
+        if hasattr(window, 'wrapper_object'):
+            window = window.wrapper_object()
+        root = window.element_info.element
+        
+        iuia = IUIA()
+        cache_request = iuia.iuia.CreateCacheRequest()
+        cache_request.AddProperty(iuia.UIA_dll.UIA_BoundingRectanglePropertyId)
+        
+        found = root.FindAllBuildCache(
+            iuia.tree_scope['descendants'], iuia.true_condition, cache_request
+        )
+        
+        count = found.Length
+        raw_elements = [found.GetElement(i) for i in range(count)]
+        
+        np = _get_numpy() if count >= _NUMPY_THRESHOLD else None
+        if np is not None:
+            def rect_values():
+                for raw_element in raw_elements:
+                    rect = raw_element.CachedBoundingRectangle
+                    yield rect.left
+                    yield rect.top
+                    yield rect.right
+                    yield rect.bottom
+            
+            rects = np.fromiter(rect_values(), dtype=np.int64, count=count * 4).reshape(count, 4)
+        else:
+            rects = []
+            for raw_element in raw_elements:
+                rect = raw_element.CachedBoundingRectangle
+                rects.append((rect.left, rect.top, rect.right, rect.bottom))
+        
+        self.logger.debug(f"UIAキャッシュで{count}件の矩形を一括取得")
+        return raw_elements, rects
+    
+    def _wrap_uia_element(self, raw_element: Any) -> Any:
+        """
+        生のIUIAutomationElementをpywinautoのUIAラッパーに変換します
+        
+        Args:
+            raw_element: IUIAutomationElement
+        
+        Returns:
+            UIAWrapper
+        """
+        from pywinauto.uia_element_info import UIAElementInfo
+        from pywinauto.controls.uiawrapper import UIAWrapper
+        
+        return UIAWrapper(UIAElementInfo(raw_element))
+    
+    def _descend_to_point(self,
+                          root: Any,
+                          point: tuple[float, float]) -> tuple[Optional[Any], Optional[tuple[int, int, int, int]]]:
+        """
+        矩形が指定座標を含む子要素をルートから順にたどり、最も深い要素を返します
+        
+        各階層では座標を含む最初の子要素にのみ降りるため、
+        問い合わせる要素数は全子孫数ではなく階層の深さに比例します。
+        
+        Args:
+            root: 探索の起点となる要素
+            point: (x, y) 座標
+        
+        Returns:
+            tuple: (座標を含む最も深い要素, その要素の矩形)。見つからない場合は (None, None)
+        """
+        x, y = point
+        found = None
+        found_rect = None
+        current = root
+        
+        # 最大20階層まで（無限ループ防止）
+        for _ in range(20):
+            try:
+                children = current.children()
+            except Exception:
+                break
+            
+            next_element = None
+            next_rect = None
+            for child in children:
+                rect = self._safe_get_rectangle(child)
+                if rect and rect[0] <= x <= rect[2] and rect[1] <= y <= rect[3]:
+                    next_element = child
+                    next_rect = rect
+                    break
+            
+            if next_element is None:
+                break
+            
+            found = next_element
+            found_rect = next_rect
+            current = next_element
+        
+        return found, found_rect
+    
+    def _get_hinted_rectangle(self, element: Any) -> Optional[tuple[int, int, int, int]]:
+        """
+        要素の矩形を取得します（同じ要素の矩形は一度だけ問い合わせる）
+        
+        ログ出力・アンカー昇格・詳細情報取得で同じ要素の rectangle() を
+        繰り返し呼び出さないよう、取得結果を要素ごとに保持します。
+        
+        Args:
+            element: 対象要素
+        
+        Returns:
+            Optional[tuple]: (left, top, right, bottom) または None
+        """
+        hint = self._rect_hints.get(id(element))
+        if hint is not None and hint[0] is element:
+            return hint[1]
+        
+        rect = self._safe_get_rectangle(element)
+        self._rect_hints[id(element)] = (element, rect)
+        return rect
     
     def _safe_get_rectangle(self, element: Any) -> Optional[tuple[int, int, int, int]]:
         """
@@ -266,72 +950,182 @@ class CursorHandler:
             rect = element.rectangle()
             if rect:
                 return (rect.left, rect.top, rect.right, rect.bottom)
-        except:
+        except _ELEMENT_ERRORS:
             pass
         return None
     
-    def _calculate_rect_distance(self, 
-                                rect1: tuple[int, int, int, int], 
-                                rect2: tuple[int, int, int, int]) -> float:
+    def _calculate_rect_distance_sq(self, 
+                                   rect1: tuple[int, int, int, int], 
+                                   rect2: tuple[int, int, int, int]) -> int:
         """
-        2つの矩形の中心点間の距離を計算します
+        2つの矩形の中心点間の距離の2乗（中心座標を2倍した整数スケール）を計算します
+        
+        最近接要素の比較には大小関係だけが必要なため、平方根は取らず、
+        中心座標の /2 も省いて整数演算のみで計算します。
+        実際の距離は sqrt(戻り値) / 2 です。
         
         Args:
             rect1: 矩形1 (left, top, right, bottom)
             rect2: 矩形2 (left, top, right, bottom)
         
         Returns:
-            float: 距離
+            int: 中心座標を2倍したスケールでの距離の2乗
         """
-        try:
-            # 矩形の中心点を計算
-            center1_x = (rect1[0] + rect1[2]) / 2
-            center1_y = (rect1[1] + rect1[3]) / 2
-            center2_x = (rect2[0] + rect2[2]) / 2
-            center2_y = (rect2[1] + rect2[3]) / 2
-            
-            # ユークリッド距離を計算
-            distance = ((center1_x - center2_x) ** 2 + (center1_y - center2_y) ** 2) ** 0.5
-            return distance
-        except:
-            return float('inf')
+        dx = (rect1[0] + rect1[2]) - (rect2[0] + rect2[2])
+        dy = (rect1[1] + rect1[3]) - (rect2[1] + rect2[3])
+        return dx * dx + dy * dy
+    
+    def _nearest_rect_index(self,
+                            rect: tuple[int, int, int, int],
+                            rects: list[tuple[int, int, int, int]]) -> tuple[int, int]:
+        """
+        候補矩形のリストのうち中心点が最も近いものを求めます
+        
+        Args:
+            rect: 基準矩形 (left, top, right, bottom)
+            rects: 候補矩形のリスト
+        
+        Returns:
+            tuple[int, int]: (最近接候補のインデックス, 距離の2乗)
+            距離は _calculate_rect_distance_sq と同じく中心座標を2倍したスケール
+        """
+        best_index = 0
+        min_distance_sq = None
+        for index, candidate in enumerate(rects):
+            distance_sq = self._calculate_rect_distance_sq(rect, candidate)
+            if min_distance_sq is None or distance_sq < min_distance_sq:
+                min_distance_sq = distance_sq
+                best_index = index
+        return best_index, min_distance_sq
+    
+    def _nearest_rect_index_numpy(self,
+                                  np: Any,
+                                  rect: tuple[int, int, int, int],
+                                  rects: Any) -> tuple[int, int]:
+        """
+        NumPyで候補矩形群のうち中心点が最も近いものを求めます
+        
+        距離計算はnumbaのカーネル（利用可能な場合）または
+        インプレース演算で一時配列の生成を抑えたNumPy演算で行います。
+        
+        Args:
+            np: numpyモジュール
+            rect: 基準矩形 (left, top, right, bottom)
+            rects: (N, 4) のint64配列
+        
+        Returns:
+            tuple[int, int]: (最近接候補のインデックス, 距離の2乗)
+            距離は _calculate_rect_distance_sq と同じく中心座標を2倍したスケール
+        """
+        px = rect[0] + rect[2]
+        py = rect[1] + rect[3]
+        
+        # numbaが利用できる場合はJITコンパイル済みのループで一度に走査する
+        kernels = _get_kernels()
+        if kernels is not None:
+            index, distance_sq = kernels.nearest_rect_index(rects, px, py)
+            return int(index), int(distance_sq)
+        
+        cx = rects[:, 0] + rects[:, 2]
+        cy = rects[:, 1] + rects[:, 3]
+        cx -= px
+        cy -= py
+        cx *= cx
+        cy *= cy
+        cx += cy
+        
+        index = int(np.argmin(cx))
+        return index, int(cx[index])
+    
+    def _get_capabilities(self, element: Any) -> frozenset:
+        """
+        要素の型で利用可能な属性名の集合を取得します
+        
+        pywinautoのラッパーでは属性の有無は型ごとに決まるため、
+        hasattrによる確認は型ごとに一度だけ行います。
+        
+        Args:
+            element: 対象要素
+        
+        Returns:
+            frozenset: 利用可能な属性名の集合
+        """
+        element_type = type(element)
+        capabilities = self._capability_cache.get(element_type)
+        if capabilities is None:
+            capabilities = frozenset(
+                name for name in _PROBED_ATTRIBUTES if hasattr(element, name)
+            )
+            self._capability_cache[element_type] = capabilities
+        return capabilities
+    
+    def _get_extractor(self, element: Any,
+                       attributes: tuple[str, ...]) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+        """
+        要素型に特化した属性取得関数の一覧を取得します
+        
+        属性の有無とメソッド/プロパティの別は型ごとに決まるため、
+        要素型と属性一覧の組ごとに一度だけ判定し、以降は判定済みの関数を呼び出します。
+        
+        Args:
+            element: 対象要素
+            attributes: 取得する属性名の一覧
+        
+        Returns:
+            tuple: (属性名, 取得関数) の組の一覧（要素型に存在しない属性は含まない）
+        """
+        element_type = type(element)
+        key = (attributes, element_type)
+        extractor = self._extractor_cache.get(key)
+        if extractor is None:
+            caps = self._get_capabilities(element)
+            extractor = tuple(
+                (name, _build_attribute_getter(element_type, name))
+                for name in attributes if name in caps
+            )
+            self._extractor_cache[key] = extractor
+        return extractor
     
-    def _log_element_info(self, element: Any, cursor_pos: tuple[int, int]) -> None:
+    def _log_wrapper_info(self, element: Any, label: str,
+                          pos: Optional[tuple[int, int]] = None) -> None:
         """
         取得した要素の情報をログ出力します
         
         Args:
             element: 要素
-            cursor_pos: カーソル位置
+            label: ログ出力時の要素の呼称（例: 'カーソル要素', '親要素'）
+            pos: カーソル位置（指定時のみ出力）
         """
         try:
             # 基本情報
-            element_type = type(element).__name__
-            self.logger.info(f"カーソル要素取得成功: {element_type}")
+            self.logger.info(f"{label}取得成功: {type(element).__name__}")
             
-            # 要素の詳細情報（可能な範囲で）
-            try:
-                window_text = element.window_text() if hasattr(element, 'window_text') else ""
-                if window_text:
-                    self.logger.debug(f"要素テキスト: '{window_text}'")
-            except:
-                pass
+            # 以降の詳細情報はCOM呼び出しを伴うため、DEBUG出力時のみ取得
+            if not self.logger.isEnabledFor(logging.DEBUG):
+                return
+            capabilities = self._get_capabilities(element)
             
-            try:
-                class_name = element.class_name() if hasattr(element, 'class_name') else ""
-                if class_name:
-                    self.logger.debug(f"クラス名: '{class_name}'")
-            except:
-                pass
+            if pos is not None:
+                self.logger.debug(f"カーソル位置: ({pos[0]}, {pos[1]})")
+            
+            # 要素の詳細情報（可能な範囲で）
+            for attr_name, caption in _PROBED_CAPTIONS:
+                if attr_name not in capabilities:
+                    continue
+                with suppress(*_ELEMENT_ERRORS):
+                    value = getattr(element, attr_name)()
+                    if value:
+                        self.logger.debug(f"{label}{caption}: '{value}'")
             
             # 矩形情報
-            rect = self._safe_get_rectangle(element)
+            rect = self._get_hinted_rectangle(element)
             if rect:
-                self.logger.debug(f"要素矩形: ({rect[0]}, {rect[1]}, {rect[2]}, {rect[3]})")
+                self.logger.debug(f"{label}矩形: ({rect[0]}, {rect[1]}, {rect[2]}, {rect[3]})")
             
         except Exception as e:
-            self.logger.debug(f"要素情報ログ出力でエラー: {e}")
+            self.logger.debug(f"{label}情報ログ出力でエラー: {e}")
 
+    @_wrap_pywinauto('親要素の取得')
     def get_parent_element(self, element: Any) -> Optional[Any]:
         """
         要素の親要素を取得します
@@ -345,72 +1139,36 @@ class CursorHandler:
         Raises:
             CursorError: 親要素の取得に失敗した場合
         """
-        try:
-            self.logger.debug("親要素の取得を開始")
-            
-            # 親要素を取得
-            parent = element.parent()
-            
-            # 親要素の妥当性チェック
-            if parent is None:
-                self.logger.info("親要素が存在しません（トップレベル要素）")
-                return None
-            
-            if parent == element:
-                self.logger.info("親要素が自分自身です（循環参照）")
-                return None
-            
-            # 親要素の情報をログ出力
-            self._log_parent_info(parent)
-            
-            return parent
-            
-        except Exception as e:
-            self.logger.error(f"親要素取得でエラー: {e}")
-            raise CursorError(f"親要素の取得に失敗しました: {e}")
-    
-    def _log_parent_info(self, parent: Any) -> None:
-        """
-        親要素の情報をログ出力します
+        self.logger.debug("親要素の取得を開始")
         
-        Args:
-            parent: 親要素
-        """
-        try:
-            # 基本情報
-            parent_type = type(parent).__name__
-            self.logger.info(f"親要素取得成功: {parent_type}")
-            
-            # 親要素の詳細情報（可能な範囲で）
-            try:
-                window_text = parent.window_text() if hasattr(parent, 'window_text') else ""
-                if window_text:
-                    self.logger.debug(f"親要素テキスト: '{window_text}'")
-            except:
-                pass
-            
-            try:
-                class_name = parent.class_name() if hasattr(parent, 'class_name') else ""
-                if class_name:
-                    self.logger.debug(f"親要素クラス名: '{class_name}'")
-            except:
-                pass
-            
-            # 矩形情報
-            rect = self._safe_get_rectangle(parent)
-            if rect:
-                self.logger.debug(f"親要素矩形: ({rect[0]}, {rect[1]}, {rect[2]}, {rect[3]})")
-            
-        except Exception as e:
-            self.logger.debug(f"親要素情報ログ出力でエラー: {e}")
+        # 親要素を取得
+        parent = element.parent()
+        
+        # 親要素の妥当性チェック
+        if parent is None:
+            self.logger.info("親要素が存在しません（トップレベル要素）")
+            return None
+        
+        if parent == element:
+            self.logger.info("親要素が自分自身です（循環参照）")
+            return None
+        
+        # 親要素の情報をログ出力
+        self._log_wrapper_info(parent, '親要素')
+        
+        return parent
     
-    def get_element_detailed_info(self, element: Any, cursor_pos: tuple[int, int]) -> Dict[str, Any]:
+    def get_element_detailed_info(self, element: Any, cursor_pos: tuple[int, int],
+                                  rect: Optional[tuple[int, int, int, int]] = None,
+                                  cheap_only: bool = False) -> Dict[str, Any]:
         """
         要素の詳細情報を取得します（uiaとwin32の両方）
         
         Args:
             element: 対象要素
             cursor_pos: カーソル位置 (x, y)
+            rect: 取得済みの要素矩形（指定時はrectangle()の呼び出しを省略）
+            cheap_only: Trueの場合、階層走査やプロセス情報など高コストな項目を省略
         
         Returns:
             Dict[str, Any]: 詳細情報の辞書
@@ -421,9 +1179,19 @@ class CursorHandler:
             'win32': {}
         }
         
+        # Win32バックエンドの情報はワーカースレッドで並行して取得する
+        # （Win32側は座標から要素を取り直すため、UIA要素をスレッド間で共有しない）
+        # Desktopのキャッシュへの書き込みをワーカーで行わないよう、投入前に作成しておく
+        # （作成に失敗した場合はワーカー側で同じ例外となり、Win32情報のエラーとして扱われる）
+        with suppress(Exception):
+            self._get_desktop('win32')
+        win32_future = self._get_executor().submit(
+            self._get_win32_element_info, element, cursor_pos, cheap_only
+        )
+        
         # UIAバックエンドで情報を取得
         try:
-            uia_info = self._get_uia_element_info(element)
+            uia_info = self._get_uia_element_info(element, rect, cheap_only)
             info['uia'] = uia_info
         except Exception as e:
             self.logger.debug(f"UIA情報取得エラー: {e}")
@@ -431,7 +1199,7 @@ class CursorHandler:
         
         # Win32バックエンドで情報を取得
         try:
-            win32_info = self._get_win32_element_info(element, cursor_pos)
+            win32_info = win32_future.result()
             info['win32'] = win32_info
         except Exception as e:
             self.logger.debug(f"Win32情報取得エラー: {e}")
@@ -439,12 +1207,42 @@ class CursorHandler:
         
         return info
     
-    def _get_uia_element_info(self, element: Any) -> Dict[str, Any]:
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        詳細情報の並行取得に使うワーカーを取得します（初回のみ作成）
+        
+        Returns:
+            ThreadPoolExecutor: COM初期化済みのワーカー
+        """
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix='elementfinder-win32',
+                initializer=co_initialize
+            )
+        return self._executor
+    
+    def close(self) -> None:
+        """
+        リソースをクリーンアップします（並行取得用のワーカーを終了）
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.logger.debug("CursorHandlerをクローズしました")
+    
+    def _get_uia_element_info(self, element: Any,
+                              rect: Optional[tuple[int, int, int, int]] = None,
+                              cheap_only: bool = False) -> Dict[str, Any]:
         """
         UIAバックエンドで要素情報を取得します
         
         Args:
             element: 対象要素
+            rect: 取得済みの要素矩形（指定時はrectangle()の呼び出しを省略）
+            cheap_only: Trueの場合、追加のCOM呼び出しや階層走査を伴う項目
+                        （_EXPENSIVE_FIELDS）を取得せずNoneとする
         
         Returns:
             Dict[str, Any]: UIA要素情報
@@ -452,107 +1250,31 @@ class CursorHandler:
         info = {}
         
         try:
-            # window_text / name
-            if hasattr(element, 'window_text'):
-                try:
-                    info['window_text'] = element.window_text()
-                except:
-                    info['window_text'] = None
-            
-            if hasattr(element, 'name'):
-                try:
-                    info['name'] = element.name
-                except:
-                    try:
-                        info['name'] = element.name()
-                    except:
-                        info['name'] = None
-            
-            # control_type
-            if hasattr(element, 'control_type'):
-                try:
-                    val = element.control_type
-                    if callable(val):
-                        info['control_type'] = val()
-                    else:
-                        info['control_type'] = val
-                except:
-                    info['control_type'] = None
+            # 単純な属性は要素型に特化した取得関数で取得
+            for key, getter in self._get_extractor(element, _UIA_INFO_ATTRIBUTES):
+                if not (cheap_only and key in _EXPENSIVE_FIELDS):
+                    info[key] = _safe_call(getter, element)
             
             # フォールバック: element_infoから取得
-            if (not info.get('control_type') and 
-                hasattr(element, 'element_info') and 
-                hasattr(element.element_info, 'control_type')):
-                try:
-                    info['control_type'] = element.element_info.control_type
-                except:
-                    pass
-            
-            # automation_id
-            if hasattr(element, 'automation_id'):
-                try:
-                    info['automation_id'] = element.automation_id()
-                except:
-                    info['automation_id'] = None
-            
-            # class_name
-            if hasattr(element, 'class_name'):
-                try:
-                    info['class_name'] = element.class_name()
-                except:
-                    info['class_name'] = None
+            if not info.get('control_type') and 'element_info' in self._get_capabilities(element):
+                info['control_type'] = _safe_call(
+                    lambda: element.element_info.control_type,
+                    default=info.get('control_type')
+                )
             
-            # friendly_class_name
-            if hasattr(element, 'friendly_class_name'):
-                try:
-                    info['friendly_class_name'] = element.friendly_class_name()
-                except:
-                    info['friendly_class_name'] = None
-            
-            # children_count
-            try:
-                children = element.children()
-                info['children_count'] = len(children) if children else 0
-            except:
-                try:
-                    children = list(element.descendants())
-                    info['children_count'] = len(children) if children else 0
-                except:
-                    info['children_count'] = None
-            
-            # depth (階層の深さ)
-            info['depth'] = self._calculate_element_depth(element)
+            if not cheap_only:
+                info['children_count'] = _safe_call(_count_children, element)
+                info['depth'] = self._calculate_element_depth(element)
+                info['process_name'] = self._get_process_name_from_element(element)
             
             # rectangle
-            rect = self._safe_get_rectangle(element)
-            if rect:
-                info['rectangle'] = {
-                    'left': rect[0],
-                    'top': rect[1],
-                    'right': rect[2],
-                    'bottom': rect[3],
-                    'width': rect[2] - rect[0],
-                    'height': rect[3] - rect[1]
-                }
-            else:
-                info['rectangle'] = None
+            if rect is None:
+                rect = self._get_hinted_rectangle(element)
+            info['rectangle'] = _rect_to_dict(rect)
             
-            # is_visible
-            if hasattr(element, 'is_visible'):
-                try:
-                    info['is_visible'] = element.is_visible()
-                except:
-                    info['is_visible'] = None
-            
-            # ハンドル
-            if hasattr(element, 'handle'):
-                try:
-                    info['handle'] = element.handle
-                except:
-                    info['handle'] = None
-            
-            # process名
-            info['process_name'] = self._get_process_name_from_element(element)
+            if cheap_only:
+                for key in _EXPENSIVE_FIELDS:
+                    info.setdefault(key, None)
             
         except Exception as e:
             self.logger.debug(f"UIA要素情報取得エラー: {e}")
@@ -560,13 +1282,15 @@ class CursorHandler:
         
         return info
     
-    def _get_win32_element_info(self, element: Any, cursor_pos: tuple[int, int]) -> Dict[str, Any]:
+    def _get_win32_element_info(self, element: Any, cursor_pos: tuple[int, int],
+                                cheap_only: bool = False) -> Dict[str, Any]:
         """
         Win32バックエンドで要素情報を取得します
         
         Args:
             element: 対象要素（UIAバックエンドの要素）
             cursor_pos: カーソル位置
+            cheap_only: Trueの場合、子要素数・深さ・プロセス名を取得せずNoneとする
         
         Returns:
             Dict[str, Any]: Win32要素情報
@@ -575,79 +1299,33 @@ class CursorHandler:
         
         try:
             # Win32バックエンドで同じ位置の要素を取得
-            desktop_win32 = Desktop(backend='win32')
+            desktop_win32 = self._get_desktop('win32')
             win32_element = desktop_win32.from_point(cursor_pos[0], cursor_pos[1])
             
             if not win32_element:
                 info['error'] = 'Win32要素が見つかりません'
                 return info
             
-            # window_text / name
-            if hasattr(win32_element, 'window_text'):
-                try:
-                    info['window_text'] = win32_element.window_text()
-                except:
-                    info['window_text'] = None
-            
-            # control_type (Win32では通常利用不可)
+            # Win32では通常利用できない項目
             info['control_type'] = None
-            
-            # automation_id (Win32では通常利用不可)
             info['automation_id'] = None
-            
-            # class_name
-            if hasattr(win32_element, 'class_name'):
-                try:
-                    info['class_name'] = win32_element.class_name()
-                except:
-                    info['class_name'] = None
-            
-            # friendly_class_name (Win32では通常利用不可)
             info['friendly_class_name'] = None
             
-            # children_count
-            try:
-                children = win32_element.children()
-                info['children_count'] = len(children) if children else 0
-            except:
-                info['children_count'] = None
+            # 単純な属性は要素型に特化した取得関数で取得
+            for key, getter in self._get_extractor(win32_element, _WIN32_INFO_ATTRIBUTES):
+                info[key] = _safe_call(getter, win32_element)
             
-            # depth (階層の深さ)
-            info['depth'] = self._calculate_element_depth(win32_element)
+            if cheap_only:
+                info['children_count'] = None
+                info['depth'] = None
+                info['process_name'] = None
+            else:
+                info['children_count'] = _safe_call(_count_children, win32_element, False)
+                info['depth'] = self._calculate_element_depth(win32_element)
+                info['process_name'] = self._get_process_name_from_element(win32_element)
             
             # rectangle
-            try:
-                rect = win32_element.rectangle()
-                if rect:
-                    info['rectangle'] = {
-                        'left': rect.left,
-                        'top': rect.top,
-                        'right': rect.right,
-                        'bottom': rect.bottom,
-                        'width': rect.width(),
-                        'height': rect.height()
-                    }
-                else:
-                    info['rectangle'] = None
-            except:
-                info['rectangle'] = None
-            
-            # is_visible
-            if hasattr(win32_element, 'is_visible'):
-                try:
-                    info['is_visible'] = win32_element.is_visible()
-                except:
-                    info['is_visible'] = None
-            
-            # ハンドル
-            if hasattr(win32_element, 'handle'):
-                try:
-                    info['handle'] = win32_element.handle
-                except:
-                    info['handle'] = None
-            
-            # process名
-            info['process_name'] = self._get_process_name_from_element(win32_element)
+            info['rectangle'] = _rect_to_dict(self._safe_get_rectangle(win32_element))
             
         except Exception as e:
             self.logger.debug(f"Win32要素情報取得エラー: {e}")
@@ -665,23 +1343,58 @@ class CursorHandler:
         Returns:
             Optional[int]: 深度、計算できない場合はNone
         """
+        # UIA要素はTreeWalkerで生のCOM要素をたどる（階層ごとのラッパー生成・比較を省く）
+        depth = self._calculate_uia_depth(element)
+        if depth is not None:
+            return depth
+        
+        depth = 0
+        current = element
         try:
-            depth = 0
-            current = element
-            
             # 最大20階層まで（無限ループ防止）
             for _ in range(20):
-                try:
-                    parent = current.parent()
-                    if parent is None or parent == current:
-                        break
-                    depth += 1
-                    current = parent
-                except:
+                parent = current.parent()
+                if parent is None or parent == current:
                     break
+                depth += 1
+                current = parent
+        except _ELEMENT_ERRORS:
+            pass
+        
+        return depth
+    
+    def _calculate_uia_depth(self, element: Any) -> Optional[int]:
+        """
+        UIAのControlViewWalkerで親をたどって要素の深さを計算します
+        
+        wrapper.parent() は階層ごとにラッパーを生成し、循環チェックの
+        比較でもRuntimeIdの取得を伴うため、生のIUIAutomationElementに対して
+        GetParentElementのみを呼び出します。UIAElementInfo.parent と同じ
+        ControlViewWalkerを使うため、深さは parent() でたどった場合と一致します。
+        
+        Args:
+            element: 対象要素
+        
+        Returns:
+            Optional[int]: 深度、UIA要素でない場合や取得に失敗した場合はNone
+        """
+        raw_element = getattr(getattr(element, 'element_info', None), 'element', None)
+        if raw_element is None:
+            return None
+        
+        try:
+            from pywinauto.uia_defines import IUIA
+            walker = IUIA().iuia.ControlViewWalker
             
+            depth = 0
+            # 最大20階層まで（無限ループ防止）
+            for _ in range(20):
+                raw_element = walker.GetParentElement(raw_element)
+                if not raw_element:
+                    break
+                depth += 1
             return depth
-        except:
+        except (ImportError,) + _ELEMENT_ERRORS:
             return None
     
     def _get_process_name_from_element(self, element: Any) -> Optional[str]:
@@ -698,26 +1411,26 @@ class CursorHandler:
             # ハンドルからプロセスIDを取得
             if hasattr(element, 'handle'):
                 handle = element.handle
+                _, win32process = _get_win32_modules()
                 
-                if _WIN32GUI_AVAILABLE:
+                if win32process is not None:
                     try:
                         _, pid = win32process.GetWindowThreadProcessId(handle)
-                        process = psutil.Process(pid)
-                        return process.name()
-                    except:
+                        name = _pid_to_process_name(pid)
+                        if name is not None:
+                            return name
+                    except _ELEMENT_ERRORS:
                         pass
             
             # process_idメソッドを試行
             if hasattr(element, 'process_id'):
                 try:
-                    pid = element.process_id()
-                    process = psutil.Process(pid)
-                    return process.name()
-                except:
+                    return _pid_to_process_name(element.process_id())
+                except _ELEMENT_ERRORS:
                     pass
             
             return None
-        except:
+        except _ELEMENT_ERRORS:
             return None
 
 
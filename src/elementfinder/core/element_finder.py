@@ -4,52 +4,278 @@ ElementFinder 要素検索・列挙機能
 pywinautoを使用してGUI要素を検索・列挙し、フィルタリングやデータ変換を行います。
 """
 
+import functools
+import logging
+import operator
+import sys
+import threading
 import time
-from typing import List, Dict, Any, Optional, Generator, Union
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Generator, Iterable, Iterator, Union
 
 from pywinauto.application import WindowSpecification
 from pywinauto.controls.hwndwrapper import HwndWrapper
 
+from ..utils.com import co_initialize
 from ..utils.exceptions import (
-    NoElementsFoundError, PywinautoError, TimeoutError,
+    ElementFinderError, NoElementsFoundError, PywinautoError, TimeoutError,
     handle_pywinauto_exception
 )
 from ..utils.logging import get_logger, log_function_call, log_performance, ProgressLogger
 
 
-@dataclass
+# numpyの遅延インポート結果（未試行の場合は_NOT_LOADED）
+_NOT_LOADED = object()
+_numpy_module = _NOT_LOADED
+
+
+def _get_numpy() -> Any:
+    """
+    numpyを初回使用時にインポートします（任意依存）
+    
+    Returns:
+        numpyモジュール、利用できない場合はNone
+    """
+    global _numpy_module
+    if _numpy_module is _NOT_LOADED:
+        try:
+            import numpy
+            _numpy_module = numpy
+        except ImportError:
+            _numpy_module = None
+    return _numpy_module
+
+
+# numbaによるJITカーネルの遅延インポート結果（未試行の場合は_NOT_LOADED）
+_kernels_module = _NOT_LOADED
+
+
+def _get_kernels() -> Any:
+    """
+    numbaでJITコンパイルする数値計算カーネルを初回使用時にインポートします（任意依存）
+    
+    Returns:
+        _element_kernelsモジュール、numbaが利用できない場合はNone
+    """
+    global _kernels_module
+    if _kernels_module is _NOT_LOADED:
+        try:
+            from . import _element_kernels
+            _kernels_module = _element_kernels
+        except ImportError:
+            _kernels_module = None
+    return _kernels_module
+
+
+# ElementInfo のフィールド名（to_dict の出力順）
+_ELEMENT_INFO_FIELDS = (
+    'index', 'depth', 'name', 'title', 'auto_id', 'control_type',
+    'class_name', 'rectangle', 'visible', 'enabled', 'path',
+)
+
+# ElementInfo の全フィールド値を _ELEMENT_INFO_FIELDS の順のタプルで取得する関数
+_get_element_info_values = operator.attrgetter(*_ELEMENT_INFO_FIELDS)
+
+
+# 大量の要素を列挙する際のメモリ使用量を抑えるため、__dict__ を持たない
+# __slots__ クラスとする（Python 3.9 ではデフォルト値付きの dataclass と
+# __slots__ を併用できないため、__init__ を明示する）
 class ElementInfo:
     """
     要素情報を格納するデータクラス
     """
-    index: int
-    depth: int
-    name: Optional[str] = None
-    title: Optional[str] = None
-    auto_id: Optional[str] = None
-    control_type: Optional[str] = None
-    class_name: Optional[str] = None
-    rectangle: Optional[List[int]] = None
-    visible: Optional[bool] = None
-    enabled: Optional[bool] = None
-    path: Optional[str] = None
+    # title は常に name と同じ値のため、格納せずプロパティで提供する
+    __slots__ = tuple(name for name in _ELEMENT_INFO_FIELDS if name != 'title')
+    
+    def __init__(self,
+                 index: int,
+                 depth: int,
+                 name: Optional[str] = None,
+                 auto_id: Optional[str] = None,
+                 control_type: Optional[str] = None,
+                 class_name: Optional[str] = None,
+                 rectangle: Optional[tuple[int, int, int, int]] = None,
+                 visible: Optional[bool] = None,
+                 enabled: Optional[bool] = None,
+                 path: Optional[str] = None):
+        self._reset(index, depth, name, auto_id, control_type,
+                    class_name, rectangle, visible, enabled, path)
+    
+    def _reset(self,
+               index: int,
+               depth: int,
+               name: Optional[str] = None,
+               auto_id: Optional[str] = None,
+               control_type: Optional[str] = None,
+               class_name: Optional[str] = None,
+               rectangle: Optional[tuple[int, int, int, int]] = None,
+               visible: Optional[bool] = None,
+               enabled: Optional[bool] = None,
+               path: Optional[str] = None) -> None:
+        """全フィールドを再設定します（プールからの再利用時に使用）"""
+        self.index = index
+        self.depth = depth
+        self.name = name
+        self.auto_id = auto_id
+        self.control_type = control_type
+        self.class_name = class_name
+        self.rectangle = rectangle
+        self.visible = visible
+        self.enabled = enabled
+        self.path = path
+    
+    @property
+    def title(self) -> Optional[str]:
+        """タイトル（nameと同じ値）"""
+        return self.name
+    
+    def __repr__(self) -> str:
+        fields = ', '.join(
+            f"{name}={value!r}"
+            for name, value in zip(_ELEMENT_INFO_FIELDS, _get_element_info_values(self))
+        )
+        return f"ElementInfo({fields})"
+    
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return _get_element_info_values(self) == _get_element_info_values(other)
+    
+    __hash__ = None
     
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
-        return {
-            'index': self.index,
-            'depth': self.depth,
-            'name': self.name,
-            'title': self.title,
-            'auto_id': self.auto_id,
-            'control_type': self.control_type,
-            'class_name': self.class_name,
-            'rectangle': self.rectangle,
-            'visible': self.visible,
-            'enabled': self.enabled,
-            'path': self.path
-        }
+        return dict(zip(_ELEMENT_INFO_FIELDS, _get_element_info_values(self)))
+    
+    @staticmethod
+    def to_records(infos: Iterable['ElementInfo']) -> List[tuple]:
+        """
+        複数の要素情報をフィールド値のタプルのリストに変換します
+        
+        辞書を作らないため、csv.writer.writerows などへの一括出力に向いています。
+        
+        Args:
+            infos: 要素情報のイテラブル
+        
+        Returns:
+            List[tuple]: _ELEMENT_INFO_FIELDS の順に並んだフィールド値のタプルのリスト
+        """
+        return list(map(_get_element_info_values, infos))
+
+
+# 要素型ごとに種別（メソッド/属性/なし）を判定するプロパティ名
+_PROBED_PROPERTIES = (
+    'window_text', 'class_name', 'is_visible', 'is_enabled', 'automation_id',
+    'control_type', 'name', 'value', 'help_text', 'rectangle', 'texts',
+)
+
+# UIAでwindow_textの次に試行するテキストプロパティ（value はテキストコントロール用）
+_UIA_TEXT_PROPERTIES = ('name', 'value', 'help_text')
+
+# フィルタで除外された ElementInfo を再利用のために保持する上限
+_POOL_LIMIT = 1024
+
+# 並行抽出でワーカー1つあたりに先行して投入する要素数
+_PREFETCH_PER_WORKER = 8
+
+# 子孫要素の記録を再利用する期間（秒）と、保持するアンカー・深度の組の上限
+_DESCENDANT_CACHE_TTL = 2.0
+_DESCENDANT_CACHE_MAXSIZE = 8
+
+# これより短い検索ではパフォーマンス情報を出力しない（秒）
+_MIN_LOGGED_DURATION = 0.001
+
+# 領域再利用モードで最初に確保する ElementInfo の数（max_items 未指定時）
+_ARENA_INITIAL_CAPACITY = 4096
+
+# 列形式出力の初期容量（max_items 未指定時）
+_COLUMNAR_INITIAL_CAPACITY = 4096
+
+# 列形式出力で object 配列として保持する文字列フィールド
+_COLUMNAR_TEXT_FIELDS = ('name', 'title', 'auto_id', 'control_type', 'class_name', 'path')
+
+# 列形式出力の三値（True/False/不明）フィールドの値
+_TRISTATE = {True: 1, False: 0, None: -1}
+
+
+def _shorten_text(text: str) -> str:
+    """長すぎるテキストを表示用に切り詰めます"""
+    if len(text) > 50:
+        return text[:47] + "..."
+    return text
+
+
+def _clean_text(value: Any) -> str:
+    """
+    テキスト候補の値を表示用のテキストに整えます
+    
+    Args:
+        value: 取得したプロパティ値
+    
+    Returns:
+        str: 前後の空白を除いて切り詰めたテキスト（文字列でない場合や空白のみの場合は空文字列）
+    """
+    if not value or not isinstance(value, str):
+        return ""
+    text = value.strip()
+    return _shorten_text(text) if text else ""
+
+
+def _intern(value: Any) -> Any:
+    """
+    多数の要素で繰り返し現れる文字列（クラス名など）を共有のオブジェクトにします
+    
+    Args:
+        value: 取得したプロパティ値
+    
+    Returns:
+        Any: 文字列の場合はインターン済みの文字列、それ以外はそのままの値
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _handle_key(element: Any) -> Any:
+    """重複除去用のキーとして要素のハンドルを返します（取得できない場合はオブジェクトID）"""
+    try:
+        return element.handle
+    except Exception:
+        return id(element)
+
+
+@functools.lru_cache(maxsize=4096)
+def _element_path(class_name: Optional[str], control_type: Optional[str], depth: int) -> str:
+    """
+    要素のパス文字列を生成します（同じ組み合わせは同じ文字列を再利用）
+    
+    Args:
+        class_name: クラス名
+        control_type: コントロールタイプ
+        depth: 深度
+    
+    Returns:
+        str: パス文字列
+    """
+    # 簡易的なパス生成
+    if control_type:
+        return f"{control_type}[{depth}]"
+    else:
+        return f"{class_name or 'Unknown'}[{depth}]"
+
+
+def _grow_columns(np: Any, columns: Dict[str, Any], capacity: int) -> None:
+    """
+    列形式出力の各配列を指定容量に拡張します（既存の値は保持）
+    
+    Args:
+        np: numpyモジュール
+        columns: 列名から配列への辞書
+        capacity: 新しい容量
+    """
+    for key, column in columns.items():
+        grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+        grown[:len(column)] = column
+        columns[key] = grown
 
 
 class ElementFinder:
@@ -57,181 +283,857 @@ class ElementFinder:
     GUI要素の検索・列挙を担当するクラス
     """
     
-    def __init__(self, backend: str = 'uia'):
+    # 要素型ごとのプロパティの種別（_get_property_schema を参照）
+    # 並行抽出時はワーカースレッドからも参照されるため、登録は _property_schema_lock の下で行う
+    _property_schema: Dict[type, Dict[str, str]] = {}
+    _property_schema_lock = threading.Lock()
+    
+    def __init__(self, backend: str = 'uia', max_workers: int = 1):
+        """
+        Args:
+            backend: 使用するバックエンド ('win32' または 'uia')
+            max_workers: 要素情報を並行して抽出するワーカー数（既定の1では逐次抽出）。
+                ワーカースレッドは要素を作成したスレッドとは別のアパートメントで動作するため、
+                呼び出し元のスレッドがMTAで初期化されている場合にのみ2以上を指定してください
+        """
+        self.backend = backend
+        self.max_workers = max_workers
+        self.logger = get_logger()
+        
+        # DEBUGログが有効か（要素ごとのログの組み立てを省くため、列挙開始時に更新する）
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
+        
+        # UIAで部分木のプロパティを一括取得するCacheRequest（初回使用時に作成）
+        self._uia_cache_request: Any = None
+        
+        # バックエンドは構築後に変わらないため、要素ごとの分岐を避けて専用の抽出処理を束縛する
+        self._extract_element_info = self._extract_uia if backend == 'uia' else self._extract_win32
+        
+        # フィルタで除外された ElementInfo の再利用プール（呼び出し元に返したものは含めない）
+        # 並行抽出時はワーカースレッドから出し入れされるため、_pool_lock の下で操作する
+        self._pool: List[ElementInfo] = []
+        self._pool_lock = threading.Lock()
+    
+        # find_elements_list(reuse_buffer=True) で呼び出しをまたいで再利用する ElementInfo の領域
+        # （_arena_top は領域の使用済み件数、領域を使用していない間はNone）
+        self._arena: List[ElementInfo] = []
+        self._arena_top: Optional[int] = None
+        
+        # 最後までたどった子孫要素の記録（(id(アンカー), 深度) -> (記録時刻, アンカー, (要素, 深度)のリスト)）
+        # GUIは変化するため、_DESCENDANT_CACHE_TTL 秒を過ぎた記録は使用しない
+        self._descendant_cache: Dict[tuple[int, Optional[int]], tuple[float, Any, list]] = {}
+    
+    def _acquire(self, *args: Any, **kwargs: Any) -> ElementInfo:
+        """
+        ElementInfo をプールから取り出して再設定します（空の場合は新規作成）
+        
+        Args:
+            *args, **kwargs: ElementInfo のフィールド値
+        
+        Returns:
+            ElementInfo: 要素情報
+        """
+        if self._arena_top is not None:
+            top = self._arena_top
+            if top == len(self._arena):
+                # 領域が不足した場合は倍に拡張する
+                self._arena.extend(ElementInfo(0, 0) for _ in range(max(top, 1)))
+            info = self._arena[top]
+            self._arena_top = top + 1
+            info._reset(*args, **kwargs)
+            return info
+        with self._pool_lock:
+            info = self._pool.pop() if self._pool else None
+        if info is None:
+            return ElementInfo(*args, **kwargs)
+        info._reset(*args, **kwargs)
+        return info
+    
+    def _release(self, info: ElementInfo) -> None:
+        """
+        出力対象外となった ElementInfo をプールに戻します
+        
+        Args:
+            info: 呼び出し元に返していない要素情報
+        """
+        if self._arena_top is not None:
+            # 領域の末尾に確保した直後の要素であれば、その位置を次の要素で再利用する
+            if self._arena_top and self._arena[self._arena_top - 1] is info:
+                self._arena_top -= 1
+            return
+        with self._pool_lock:
+            if len(self._pool) < _POOL_LIMIT:
+                self._pool.append(info)
+    
+    @log_function_call
+    @handle_pywinauto_exception
+    def find_elements(self,
+                     anchor: Union[WindowSpecification, HwndWrapper],
+                     depth: Optional[int] = 3,
+                     only_visible: bool = False,
+                     max_items: Optional[int] = None) -> Iterator[ElementInfo]:
+        """
+        指定されたアンカー以下の要素を順次検索・列挙するイテレータを返します
+        
+        要素は取り出されるたびに取得されるため、結果をすべて保持せずに
+        順次書き出す呼び出し元では、メモリ使用量が要素数に比例しません。
+        一覧が必要な場合は find_elements_list を使用します。
+        
+        Args:
+            anchor: 検索の起点となるアンカー要素
+            depth: 検索する深度（Noneの場合は無制限）
+            only_visible: 可視要素のみを対象とするか
+            max_items: 最大取得件数
+        
+        Returns:
+            Iterator[ElementInfo]: 要素情報のイテレータ
+        
+        Raises:
+            NoElementsFoundError: 要素が見つからない場合（最初の要素の取得時に判定）
+            PywinautoError: pywinauto操作エラー（列挙の途中で発生した場合は反復時に送出）
+        """
+        self.logger.info(f"要素検索開始: backend={self.backend}, depth={depth}, only_visible={only_visible}, "
+                       f"max_items={max_items}")
+        
+        start_time = time.time()
+        elements = self._enumerate_elements(anchor, depth, only_visible, max_items)
+        
+        # 要素が1件もない場合は反復開始前に検出できるよう、最初の要素だけ先に取得する
+        first = next(elements, None)
+        if first is None:
+            filter_desc = self._build_filter_description(only_visible, max_items)
+            raise NoElementsFoundError(filter_desc)
+        
+        return self._stream_elements(first, elements, start_time)
+    
+    def _stream_elements(self,
+                         first: ElementInfo,
+                         elements: Iterator[ElementInfo],
+                         start_time: float) -> Generator[ElementInfo, None, None]:
+        """
+        先に取得した最初の要素に続けて残りの要素を返すジェネレータ
+        
+        Args:
+            first: 最初の要素情報
+            elements: 残りの要素情報のイテレータ
+            start_time: 検索開始時刻
+        
+        Yields:
+            ElementInfo: 要素情報
+        """
+        count = 1
+        yield first
+        
+        try:
+            for element_info in elements:
+                count += 1
+                yield element_info
+        except Exception as e:
+            duration = time.time() - start_time
+            self.logger.error(f"要素検索失敗 ({duration:.2f}秒): {e}")
+            raise PywinautoError(e, "要素検索")
+        
+        duration = time.time() - start_time
+        if duration >= _MIN_LOGGED_DURATION:
+            log_performance("要素検索", duration, count)
+        self.logger.info(f"要素検索完了: {count}件取得")
+    
+    @log_function_call
+    @handle_pywinauto_exception
+    def find_elements_list(self,
+                           anchor: Union[WindowSpecification, HwndWrapper],
+                           depth: Optional[int] = 3,
+                           only_visible: bool = False,
+                           max_items: Optional[int] = None,
+                           reuse_buffer: bool = False) -> List[ElementInfo]:
+        """
+        指定されたアンカー以下の要素を検索・列挙します
+        
+        Args:
+            anchor: 検索の起点となるアンカー要素
+            depth: 検索する深度（Noneの場合は無制限）
+            only_visible: 可視要素のみを対象とするか
+            max_items: 最大取得件数
+            reuse_buffer: Trueの場合、このインスタンスが確保済みの ElementInfo を
+                          上書きして返す（同じインスタンスで繰り返し検索する場合に
+                          生成を省けるが、結果は次の reuse_buffer=True の呼び出しで無効になる）
+        
+        Returns:
+            List[ElementInfo]: 要素情報のリスト
+        
+        Raises:
+            NoElementsFoundError: 要素が見つからない場合
+            PywinautoError: pywinauto操作エラー
+        """
+        start_time = time.time()
+        self.logger.info(f"要素検索開始: backend={self.backend}, depth={depth}, only_visible={only_visible}, "
+                       f"max_items={max_items}")
+        
+        try:
+            # 要素を段階的に取得（アンカー自身も含む）
+            if reuse_buffer:
+                elements = self._enumerate_into_arena(anchor, depth, only_visible, max_items)
+            else:
+                elements = list(self._enumerate_elements(
+                    anchor, depth, only_visible, max_items
+                ))
+        except Exception as e:
+            duration = time.time() - start_time
+            self.logger.error(f"要素検索失敗 ({duration:.2f}秒): {e}")
+            raise PywinautoError(e, "要素検索")
+        
+        duration = time.time() - start_time
+        if duration >= _MIN_LOGGED_DURATION:
+            log_performance("要素検索", duration, len(elements))
+        
+        if not elements:
+            filter_desc = self._build_filter_description(only_visible, max_items)
+            raise NoElementsFoundError(filter_desc)
+        
+        self.logger.info(f"要素検索完了: {len(elements)}件取得")
+        return elements
+    
+    def _enumerate_into_arena(self,
+                              anchor: Union[WindowSpecification, HwndWrapper],
+                              depth: Optional[int],
+                              only_visible: bool,
+                              max_items: Optional[int]) -> List[ElementInfo]:
+        """
+        確保済みの ElementInfo 領域に要素情報を書き込みながら列挙します
+        
+        Args:
+            anchor: アンカー要素
+            depth: 検索深度
+            only_visible: 可視要素のみフラグ
+            max_items: 最大件数
+        
+        Returns:
+            List[ElementInfo]: 領域の先頭から使用した部分
+        """
+        if not self._arena:
+            capacity = max_items or _ARENA_INITIAL_CAPACITY
+            self._arena = [ElementInfo(0, 0) for _ in range(capacity)]
+        
+        self._arena_top = 0
+        try:
+            for _ in self._enumerate_elements(anchor, depth, only_visible, max_items):
+                pass
+            return self._arena[:self._arena_top]
+        finally:
+            self._arena_top = None
+    
+    @log_function_call
+    @handle_pywinauto_exception
+    def find_elements_columnar(self,
+                               anchor: Union[WindowSpecification, HwndWrapper],
+                               depth: Optional[int] = 3,
+                               only_visible: bool = False,
+                               max_items: Optional[int] = None) -> Dict[str, Any]:
+        """
+        指定されたアンカー以下の要素を列形式（フィールドごとのnumpy配列）で取得します
+        
+        要素ごとのオブジェクトを保持しないため、大量の要素に対する絞り込みや
+        集計を配列演算で行えます（例: rectangle[:, 2] - rectangle[:, 0] > 0）。
+        
+        Args:
+            anchor: 検索の起点となるアンカー要素
+            depth: 検索する深度（Noneの場合は無制限）
+            only_visible: 可視要素のみを対象とするか
+            max_items: 最大取得件数
+        
+        Returns:
+            Dict[str, Any]: 列名から配列への辞書
+                - index (int32), depth (int16): 要素番号と深度
+                - rectangle (int32, N×4), has_rectangle (bool): 矩形と取得可否
+                - visible, enabled (int8): 1=真, 0=偽, -1=不明
+                - name, title, auto_id, control_type, class_name, path (object)
+        
+        Raises:
+            ElementFinderError: numpyが利用できない場合
+            NoElementsFoundError: 要素が見つからない場合
+            PywinautoError: pywinauto操作エラー
+        """
+        np = _get_numpy()
+        if np is None:
+            raise ElementFinderError("列形式での要素取得にはnumpyが必要です")
+        
+        start_time = time.time()
+        
+        try:
+            capacity = max_items or _COLUMNAR_INITIAL_CAPACITY
+            columns = {
+                'index': np.zeros(capacity, dtype=np.int32),
+                'depth': np.zeros(capacity, dtype=np.int16),
+                'rectangle': np.zeros((capacity, 4), dtype=np.int32),
+                'has_rectangle': np.zeros(capacity, dtype=np.bool_),
+                'visible': np.zeros(capacity, dtype=np.int8),
+                'enabled': np.zeros(capacity, dtype=np.int8),
+            }
+            for key in _COLUMNAR_TEXT_FIELDS:
+                columns[key] = np.empty(capacity, dtype=object)
+            
+            count = 0
+            for element_info in self._enumerate_elements(anchor, depth, only_visible, max_items):
+                if count == capacity:
+                    capacity *= 2
+                    _grow_columns(np, columns, capacity)
+                
+                columns['index'][count] = element_info.index
+                columns['depth'][count] = element_info.depth
+                if element_info.rectangle:
+                    columns['rectangle'][count] = element_info.rectangle
+                    columns['has_rectangle'][count] = True
+                columns['visible'][count] = _TRISTATE.get(element_info.visible, -1)
+                columns['enabled'][count] = _TRISTATE.get(element_info.enabled, -1)
+                for key in _COLUMNAR_TEXT_FIELDS:
+                    columns[key][count] = getattr(element_info, key)
+                count += 1
+                
+                # 値は配列に写したため、要素情報は再利用できる
+                self._release(element_info)
+        except Exception as e:
+            duration = time.time() - start_time
+            self.logger.error(f"要素検索失敗 ({duration:.2f}秒): {e}")
+            raise PywinautoError(e, "要素検索")
+        
+        duration = time.time() - start_time
+        if duration >= _MIN_LOGGED_DURATION:
+            log_performance("要素検索（列形式）", duration, count)
+        
+        if not count:
+            filter_desc = self._build_filter_description(only_visible, max_items)
+            raise NoElementsFoundError(filter_desc)
+        
+        self.logger.info(f"要素検索完了: {count}件取得")
+        return {key: column[:count] for key, column in columns.items()}
+    
+    def filter_visible_columns(self, columns: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        列形式の要素情報から可視要素のみの条件を満たす要素を抽出します
+        
+        only_visible=False で一度取得した結果から、要素を取り直さずに
+        可視要素のみの結果を作る場合に使用します（判定は _should_include_element と同じ）。
+        
+        Args:
+            columns: find_elements_columnar の戻り値
+        
+        Returns:
+            Dict[str, Any]: 条件を満たす要素のみの列形式の要素情報
+        """
+        visible = columns['visible']
+        enabled = columns['enabled']
+        
+        # numbaが利用できる場合はJITコンパイル済みのループで一度に判定する
+        kernels = _get_kernels()
+        if kernels is not None:
+            mask = kernels.mask_visible(visible, enabled)
+        else:
+            mask = (visible != 0) & (enabled != 0)
+        
+        return {key: column[mask] for key, column in columns.items()}
+    
+    def _enumerate_elements(self,
+                           anchor: Union[WindowSpecification, HwndWrapper],
+                           depth: Optional[int],
+                           only_visible: bool,
+                           max_items: Optional[int]) -> Generator[ElementInfo, None, None]:
+        """
+        要素を段階的に列挙するジェネレータ
+        
+        Args:
+            anchor: アンカー要素
+            depth: 検索深度
+            only_visible: 可視要素のみフラグ
+            max_items: 最大件数
+        
+        Yields:
+            ElementInfo: 要素情報
+        """
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
+        
+        # 負の深度ではアンカー自身も対象外のため、要素に触れずに終了
+        if depth is not None and depth < 0:
+            self.logger.debug(f"depth={depth}のため、要素を列挙せずに終了")
+            return
+        
+        try:
+            yielded_count = 0
+            element_count = 0
+            
+            # 1. まずアンカー要素自身を最上位として出力
+            try:
+                # 除外が確定するアンカーは情報抽出の前に判定して、プロパティ取得を省く
+                anchor_state = self._read_state(anchor, only_visible)
+                if anchor_state is None:
+                    self.logger.debug("アンカー要素は非表示または無効のため出力対象外")
+                else:
+                    anchor_info = self._extract_element_info(anchor, yielded_count, 0, anchor_state)  # depth=0 for top level
+                    if self._should_include_element(anchor_info, only_visible):
+                        yield anchor_info
+                        yielded_count += 1
+                        
+                        # 最大件数チェック（max_items=1 の場合は子孫要素を取得せずに終了）
+                        if max_items and yielded_count >= max_items:
+                            self.logger.debug(f"最大件数到達: {max_items}")
+                            return
+                    else:
+                        self._release(anchor_info)
+                        
+                self.logger.debug("アンカー要素自身を最上位レベルとして追加")
+            except Exception as e:
+                self.logger.debug(f"アンカー要素の情報取得失敗: {e}")
+            
+            # depth=0の場合はアンカー要素のみで終了
+            if depth is not None and depth <= 0:
+                self.logger.debug(f"depth={depth}のため、アンカー要素のみで終了")
+                return
+            
+            # 2. 子孫要素を取得し、要素情報を抽出
+            extracted = self._extract_descendants(anchor, depth, only_visible, max_items)
+            
+            # プログレス表示の準備（多数の要素が想定される場合）
+            progress = None
+            next_progress = 1000  # 次にプログレスを更新する件数
+            
+            # ループ内での属性参照を省くため、ローカル変数に束縛
+            release = self._release
+            
+            try:
+                for element_info in extracted:
+                    element_count += 1
+                    
+                    # プログレス表示（1000件に達した後は100件ごと）
+                    if element_count >= next_progress:
+                        if progress is None:
+                            progress = ProgressLogger("要素取得", 10000)  # 概算
+                        progress.update(100)
+                        next_progress += 100
+                    
+                    if element_info is None:
+                        continue
+                    
+                    # フィルタリング（_should_include_element と同じ判定を要素ごとの呼び出しなしで行う）
+                    if only_visible and (element_info.visible is False or element_info.enabled is False):
+                        release(element_info)
+                        continue
+                    
+                    element_info.index = yielded_count
+                    yield element_info
+                    yielded_count += 1
+                    
+                    # 最大件数チェック
+                    if max_items and yielded_count >= max_items:
+                        self.logger.debug(f"最大件数到達: {max_items}")
+                        break
+            finally:
+                # 打ち切った場合は未着手の抽出を取り消す
+                extracted.close()
+            
+            if progress:
+                progress.complete()
+            
+            self.logger.debug(f"要素列挙完了: 総数={element_count + 1}, 出力={yielded_count}")
+            
+        except Exception as e:
+            self.logger.error(f"要素列挙エラー: {e}")
+            raise
+    
+    def _extract_descendants(self,
+                             anchor: Union[WindowSpecification, HwndWrapper],
+                             depth: Optional[int],
+                             only_visible: bool,
+                             max_items: Optional[int] = None) -> Iterator[Optional[ElementInfo]]:
+        """
+        アンカー配下の子孫要素を取得し、要素情報を列挙順に返すイテレータを作成します
+        
+        Args:
+            anchor: アンカー要素
+            depth: 検索深度
+            only_visible: 可視要素のみフラグ
+            max_items: 最大件数
+        
+        Returns:
+            Iterator: _extract_candidate の結果のイテレータ
+        """
+        # 同じアンカー・深度への短時間の連続検索では、前回たどった子孫要素を再利用
+        cached_descendants = self._get_cached_descendants(anchor, depth)
+        if cached_descendants is not None:
+            self.logger.debug(f"子孫要素 {len(cached_descendants)}件を再利用")
+            return self._extract_each(iter(cached_descendants), only_visible)
+        
+        # UIAではCacheRequestで子孫要素のプロパティを一度のCOM呼び出しでまとめて取得
+        # （部分木全体を取得するため、深度や件数で途中までしかたどらない場合は使用しない）
+        if self.backend == 'uia' and depth is None and not max_items:
+            extracted = self._extract_with_uia_cache(anchor, depth, only_visible)
+            if extracted is not None:
+                return extracted
+        
+        children = []
+        try:
+            children = list(anchor.children())
+            self.logger.debug(f"children()で{len(children)}件の直下子要素を取得")
+        except Exception as e:
+            self.logger.debug(f"children()取得失敗: {e}")
+            # 子要素が取得できない場合は空リストのまま
+        
+        if children:
+            # 深度を保持しながら子要素を順にたどる（親要素をたどって深度を求める必要がない）
+            descendants = self._record_descendants(
+                anchor, depth, self._iter_descendants(children, depth)
+            )
+        elif depth is not None:
+            # 子孫要素がない場合は、アンカー周辺の要素も検索（アンカー自身は除く）
+            self.logger.debug("子孫要素がないため、アンカー周辺の要素を検索します")
+            related_elements = self._get_related_elements(anchor)
+            # アンカー自身は既に追加済みなので除外
+            descendants = ((elem, 1) for elem in related_elements if elem != anchor)
+        else:
+            descendants = iter(())
+        
+        return self._extract_each(descendants, only_visible)
+    
+    def _extract_each(self,
+                      descendants: Iterator[tuple[HwndWrapper, int]],
+                      only_visible: bool) -> Iterator[Optional[ElementInfo]]:
+        """
+        子孫要素ごとに要素情報を抽出するイテレータを作成します
+        
+        COM呼び出しの待ち時間が支配的なため、可能な場合はワーカースレッドで並行して抽出します。
+        
+        Args:
+            descendants: (要素, 深度) のイテレータ
+            only_visible: 可視要素のみフラグ
+        
+        Returns:
+            Iterator: _extract_candidate の結果のイテレータ
+        """
+        if self.max_workers > 1 and self._arena_top is None:
+            return self._extract_concurrently(descendants, only_visible)
+        extract = self._extract_candidate
+        return (
+            extract(element, element_depth, only_visible)
+            for element, element_depth in descendants
+        )
+    
+    def _extract_with_uia_cache(self,
+                                anchor: Union[WindowSpecification, HwndWrapper],
+                                depth: Optional[int],
+                                only_visible: bool) -> Optional[Iterator[Optional[ElementInfo]]]:
+        """
+        UIAのCacheRequestでアンカー配下のプロパティを一括取得し、要素情報を列挙します
+        
+        要素ごと・プロパティごとのCOM呼び出し（プロセス間通信）の代わりに、
+        アンカーの部分木全体のプロパティを一度の BuildUpdatedCache で取得し、
+        以降はキャッシュ済みの値を読み取ります（テキストは _extract_uia_cached を参照）。
+        部分木全体を取得するため、深度・件数の指定がない場合にのみ使用します。
+        
+        Args:
+            anchor: アンカー要素
+            depth: 検索深度
+            only_visible: 可視要素のみフラグ
+        
+        Returns:
+            Optional[Iterator]: _extract_candidate と同じ形式の要素情報のイテレータ。
+            一括取得できない場合や子要素がない場合はNone（通常の取得処理を使用）
+        """
+        try:
+            from pywinauto.uia_defines import IUIA
+            
+            wrapper = anchor.wrapper_object() if hasattr(anchor, 'wrapper_object') else anchor
+            root = wrapper.element_info.element.BuildUpdatedCache(self._get_uia_cache_request())
+            children = self._get_cached_children(root)
+        except Exception as e:
+            self.logger.debug(f"UIAキャッシュによる一括取得に失敗: {e}")
+            return None
+        
+        if not children:
+            return None
+        
+        self.logger.debug("UIAキャッシュで子孫要素のプロパティを一括取得")
+        iuia = IUIA()
+        control_type_names = iuia.known_control_type_ids
+        text_pattern_property_id = iuia.UIA_dll.UIA_IsTextPatternAvailablePropertyId
+        extract = self._extract_uia_cached
+        return (
+            extract(
+                raw_element, element_depth, only_visible, control_type_names, text_pattern_property_id
+            )
+            for raw_element, element_depth in self._iter_cached_descendants(children, depth)
+        )
+    
+    def _get_uia_cache_request(self) -> Any:
+        """
+        要素情報の抽出に使うプロパティを部分木ごと取得するCacheRequestを取得します（初回のみ作成）
+        
+        Returns:
+            IUIAutomationCacheRequest
+        """
+        if self._uia_cache_request is None:
+            from pywinauto.uia_defines import IUIA
+            
+            iuia = IUIA()
+            uia = iuia.UIA_dll
+            cache_request = iuia.iuia.CreateCacheRequest()
+            for property_id in (
+                uia.UIA_NamePropertyId, uia.UIA_AutomationIdPropertyId,
+                uia.UIA_ControlTypePropertyId, uia.UIA_ClassNamePropertyId,
+                uia.UIA_BoundingRectanglePropertyId, uia.UIA_IsEnabledPropertyId,
+                uia.UIA_IsOffscreenPropertyId, uia.UIA_IsTextPatternAvailablePropertyId,
+            ):
+                cache_request.AddProperty(property_id)
+            cache_request.TreeScope = iuia.tree_scope['subtree']
+            # 既定のControlViewではなく、children() と同じRawViewの要素をたどる
+            cache_request.TreeFilter = iuia.true_condition
+            # テキストを実体の要素から取得する場合があるため、既定のAutomationElementMode_Fullのままとする
+            self._uia_cache_request = cache_request
+        return self._uia_cache_request
+    
+    def _get_cached_children(self, raw_element: Any) -> List[Any]:
+        """
+        キャッシュ済みの子要素を取得します
+        
+        Args:
+            raw_element: キャッシュ構築済みのIUIAutomationElement
+        
+        Returns:
+            List[Any]: 子要素のIUIAutomationElementのリスト
+        """
+        cached_children = raw_element.GetCachedChildren()
+        if not cached_children:
+            return []
+        return [cached_children.GetElement(i) for i in range(cached_children.Length)]
+    
+    def _iter_cached_descendants(self,
+                                 children: List[Any],
+                                 depth: Optional[int]) -> Generator[tuple[Any, int], None, None]:
+        """
+        キャッシュ済みの子孫要素を深度とともに列挙するジェネレータ（_iter_descendants と同じ順序）
+        
+        Args:
+            children: アンカー直下の子要素
+            depth: 検索深度（Noneの場合は無制限）
+        
+        Yields:
+            tuple: (IUIAutomationElement, アンカーからの深度)
+        """
+        stack = [(child, 1) for child in reversed(children)]
+        pop = stack.pop
+        push = stack.extend
+        get_children = self._get_cached_children
+        
+        while stack:
+            raw_element, element_depth = pop()
+            yield raw_element, element_depth
+            
+            if depth is not None and element_depth >= depth:
+                continue
+            
+            try:
+                grandchildren = get_children(raw_element)
+            except Exception as e:
+                if self._debug:
+                    self.logger.debug(f"キャッシュ済み子要素の取得失敗: {e}")
+                continue
+            
+            push((child, element_depth + 1) for child in reversed(grandchildren))
+    
+    def _extract_uia_cached(self,
+                            raw_element: Any,
+                            depth: int,
+                            only_visible: bool,
+                            control_type_names: Dict[int, str],
+                            text_pattern_property_id: int) -> Optional[ElementInfo]:
+        """
+        キャッシュ済みのプロパティから要素情報を抽出します（インデックスは出力時に設定）
+        
+        テキストは _extract_uia と同じ結果になるよう、window_text() がNameを返すと
+        判定できる要素（Nameが空でなく、TextPatternを持たないかクラス名が空）のみ
+        キャッシュ済みのNameを使用します。それ以外はTextPatternの本文や texts()、
+        子要素のテキストを使用し得るため、実体の要素から _extract_element_text で取得します。
+        
+        Args:
+            raw_element: キャッシュ構築済みのIUIAutomationElement
+            depth: 深度
+            only_visible: 可視要素のみフラグ
+            control_type_names: コントロールタイプIDから名前への辞書
+            text_pattern_property_id: TextPatternの利用可否を示すプロパティのID
+        
+        Returns:
+            Optional[ElementInfo]: 要素情報、除外が確定した場合はNone
+        """
+        try:
+            visible = not raw_element.CachedIsOffscreen
+            enabled = bool(raw_element.CachedIsEnabled)
+            if only_visible and not (visible and enabled):
+                return None
+            
+            control_type = control_type_names.get(raw_element.CachedControlType)
+            class_name = _intern(raw_element.CachedClassName)
+            rect = raw_element.CachedBoundingRectangle
+            
+            name = _clean_text(raw_element.CachedName)
+            if not name or (class_name and raw_element.GetCachedPropertyValue(text_pattern_property_id)):
+                name = self._extract_element_text(
+                    self._wrap_uia_element(raw_element), _UIA_TEXT_PROPERTIES
+                )
+            
+            return self._acquire(
+                index=0,
+                depth=depth,
+                name=name,
+                auto_id=raw_element.CachedAutomationId,
+                control_type=control_type,
+                class_name=class_name,
+                rectangle=(rect.left, rect.top, rect.right, rect.bottom),
+                visible=visible,
+                enabled=enabled,
+                path=self._generate_element_path(class_name, control_type, depth)
+            )
+        
+        except Exception as e:
+            return self._build_failed_element_info(0, depth, e)
+    
+    def _wrap_uia_element(self, raw_element: Any) -> HwndWrapper:
         """
+        IUIAutomationElementをpywinautoのUIAラッパーに変換します
+        
         Args:
-            backend: 使用するバックエンド ('win32' または 'uia')
+            raw_element: IUIAutomationElement
+        
+        Returns:
+            コントロールタイプに応じたUIAラッパー
         """
-        self.backend = backend
-        self.logger = get_logger()
+        from pywinauto.controls.uiawrapper import UIAWrapper
+        from pywinauto.uia_element_info import UIAElementInfo
+        
+        return UIAWrapper(UIAElementInfo(raw_element))
     
-    @log_function_call
-    @handle_pywinauto_exception
-    def find_elements(self,
-                     anchor: Union[WindowSpecification, HwndWrapper],
-                     depth: Optional[int] = 3,
-                     only_visible: bool = False,
-                     max_items: Optional[int] = None) -> List[ElementInfo]:
+    def _extract_candidate(self,
+                           element: HwndWrapper,
+                           depth: int,
+                           only_visible: bool) -> Optional[ElementInfo]:
         """
-        指定されたアンカー以下の要素を検索・列挙します
+        出力候補の要素から情報を抽出します（インデックスは出力時に設定）
         
         Args:
-            anchor: 検索の起点となるアンカー要素
-            depth: 検索する深度（Noneの場合は無制限）
-            only_visible: 可視要素のみを対象とするか
-            max_items: 最大取得件数
+            element: pywinauto要素
+            depth: 深度
+            only_visible: 可視要素のみフラグ
         
         Returns:
-            List[ElementInfo]: 要素情報のリスト
+            Optional[ElementInfo]: 要素情報、除外が確定した場合や取得に失敗した場合はNone
+        """
+        try:
+            # 除外される要素は情報抽出の前に判定して、プロパティ取得を省く
+            state = self._read_state(element, only_visible)
+            if state is None:
+                return None
+            return self._extract_element_info(element, 0, depth, state)
+        except Exception as e:
+            # 個別要素のエラーは無視して継続
+            if self._debug:
+                self.logger.debug(f"要素情報取得失敗: {e}")
+            return None
+    
+    def _extract_concurrently(self,
+                              descendants: Iterator[tuple[HwndWrapper, int]],
+                              only_visible: bool) -> Generator[Optional[ElementInfo], None, None]:
+        """
+        子孫要素の情報をワーカースレッドで並行して抽出し、列挙順に返すジェネレータ
         
-        Raises:
-            NoElementsFoundError: 要素が見つからない場合
-            PywinautoError: pywinauto操作エラー
+        子孫要素は呼び出し元のスレッドで順にたどり、先行して抽出する件数を
+        ワーカー数の _PREFETCH_PER_WORKER 倍までに抑えます。
+        そのため、最大件数で打ち切った場合に無駄になる抽出も同程度に収まります。
+        
+        Args:
+            descendants: (要素, 深度) のイテレータ
+            only_visible: 可視要素のみフラグ
+        
+        Yields:
+            Optional[ElementInfo]: _extract_candidate の結果
         """
-        start_time = time.time()
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='elementfinder-extract',
+            initializer=co_initialize
+        )
+        limit = self.max_workers * _PREFETCH_PER_WORKER
+        pending = deque()
         
         try:
-            self.logger.info(f"要素検索開始: backend={self.backend}, depth={depth}, only_visible={only_visible}, "
-                           f"max_items={max_items}")
-            
-            # 要素を段階的に取得（アンカー自身も含む）
-            elements = list(self._enumerate_elements(
-                anchor, depth, only_visible, max_items
-            ))
-            
-            duration = time.time() - start_time
-            log_performance("要素検索", duration, len(elements))
-            
-            if not elements:
-                filter_desc = self._build_filter_description(only_visible, max_items)
-                raise NoElementsFoundError(filter_desc)
-            
-            self.logger.info(f"要素検索完了: {len(elements)}件取得")
-            return elements
+            for element, element_depth in descendants:
+                pending.append(executor.submit(
+                    self._extract_candidate, element, element_depth, only_visible
+                ))
+                if len(pending) >= limit:
+                    yield pending.popleft().result()
             
-        except NoElementsFoundError:
-            raise
-        except Exception as e:
-            duration = time.time() - start_time
-            self.logger.error(f"要素検索失敗 ({duration:.2f}秒): {e}")
-            raise PywinautoError(e, "要素検索")
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # 打ち切られた場合も実行中の抽出を待ってからワーカーを終了する
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
     
-    def _enumerate_elements(self,
-                           anchor: Union[WindowSpecification, HwndWrapper],
-                           depth: Optional[int],
-                           only_visible: bool,
-                           max_items: Optional[int]) -> Generator[ElementInfo, None, None]:
+    def _get_cached_descendants(self,
+                                anchor: Union[WindowSpecification, HwndWrapper],
+                                depth: Optional[int]) -> Optional[List[tuple[HwndWrapper, int]]]:
         """
-        要素を段階的に列挙するジェネレータ
+        有効期間内に記録した子孫要素を取得します
         
         Args:
             anchor: アンカー要素
             depth: 検索深度
-            only_visible: 可視要素のみフラグ
-            max_items: 最大件数
+        
+        Returns:
+            Optional[List[tuple]]: (要素, 深度) のリスト、記録がない場合はNone
+        """
+        cached = self._descendant_cache.get((id(anchor), depth))
+        if cached is None:
+            return None
+        recorded_at, cached_anchor, descendants = cached
+        # id の再利用で別のアンカーに一致しないよう、同一オブジェクトであることも確認する
+        if cached_anchor is not anchor or time.monotonic() - recorded_at >= _DESCENDANT_CACHE_TTL:
+            del self._descendant_cache[(id(anchor), depth)]
+            return None
+        return descendants
+    
+    def _record_descendants(self,
+                            anchor: Union[WindowSpecification, HwndWrapper],
+                            depth: Optional[int],
+                            descendants: Iterator[tuple[HwndWrapper, int]]) -> Generator[tuple[HwndWrapper, int], None, None]:
+        """
+        子孫要素を列挙しながら記録し、最後までたどった場合のみ再利用できるよう保存します
+        
+        Args:
+            anchor: アンカー要素
+            depth: 検索深度
+            descendants: (要素, 深度) のイテレータ
         
         Yields:
-            ElementInfo: 要素情報
+            tuple: (要素, アンカーからの深度)
         """
-        try:
-            yielded_count = 0
-            element_count = 0
-            
-            # 1. まずアンカー要素自身を最上位として出力
-            try:
-                anchor_info = self._extract_element_info(anchor, yielded_count, 0)  # depth=0 for top level
-                if self._should_include_element(anchor_info, only_visible):
-                    yield anchor_info
-                    yielded_count += 1
-                    
-                    # 最大件数チェック
-                    if max_items and yielded_count >= max_items:
-                        self.logger.debug(f"最大件数到達: {max_items}")
-                        return
-                        
-                self.logger.debug("アンカー要素自身を最上位レベルとして追加")
-            except Exception as e:
-                self.logger.debug(f"アンカー要素の情報取得失敗: {e}")
-            
-            # depth=0の場合はアンカー要素のみで終了
-            if depth is not None and depth <= 0:
-                self.logger.debug(f"depth={depth}のため、アンカー要素のみで終了")
-                return
-            
-            # 2. 子孫要素を取得
-            descendants = []
-            try:
-                if depth is None:
-                    # 無制限の場合
-                    descendants = list(anchor.descendants())
-                elif depth == 1:
-                    # depth=1の場合、直下の子要素のみを取得
-                    try:
-                        descendants = list(anchor.children())
-                        self.logger.debug(f"children()で{len(descendants)}件の直下子要素を取得")
-                    except Exception as e:
-                        self.logger.debug(f"children()取得失敗: {e}")
-                        descendants = []
-                else:
-                    # depth >= 2の場合、pywinautoのdescendantsを使用
-                    # ユーザー入力のdepth=2 -> pywinautoのdepth=1（孫要素まで）
-                    pywinauto_depth = depth - 1
-                    descendants = list(anchor.descendants(depth=pywinauto_depth))
-                    self.logger.debug(f"pywinauto descendants(depth={pywinauto_depth})で取得")
-            except Exception as e:
-                self.logger.debug(f"descendants()取得失敗: {e}")
-                # 子孫要素が取得できない場合は空リストのまま
-            
-            self.logger.debug(f"descendants()で{len(descendants)}件の子孫要素を取得")
-            
-            # 子孫要素がない場合は、アンカー周辺の要素も検索（アンカー自身は除く）
-            if not descendants and depth is not None and depth > 0:
-                self.logger.debug("子孫要素がないため、アンカー周辺の要素を検索します")
-                related_elements = self._get_related_elements(anchor)
-                # アンカー自身は既に追加済みなので除外
-                descendants = [elem for elem in related_elements if elem != anchor]
-            
-            # プログレス表示の準備（多数の要素が想定される場合）
-            progress = None
-            
-            for element in descendants:
-                element_count += 1
-                
-                # プログレス表示（1000件を超える場合）
-                if element_count == 1000 and not progress:
-                    progress = ProgressLogger("要素取得", 10000)  # 概算
-                
-                if progress and element_count % 100 == 0:
-                    progress.update(100)
-                
-                try:
-                    # 要素情報の取得 - 簡易的な深度計算（高速化のため）
-                    relative_depth = self._calculate_fast_depth(element, yielded_count)
-                    element_info = self._extract_element_info(element, yielded_count, relative_depth)
-                    
-                    # フィルタリング
-                    if self._should_include_element(element_info, only_visible):
-                        yield element_info
-                        yielded_count += 1
-                        
-                        # 最大件数チェック
-                        if max_items and yielded_count >= max_items:
-                            self.logger.debug(f"最大件数到達: {max_items}")
-                            break
-                
-                except Exception as e:
-                    # 個別要素のエラーは無視して継続
-                    self.logger.debug(f"要素情報取得失敗: {e}")
-                    continue
-            
-            if progress:
-                progress.complete()
-            
-            self.logger.debug(f"要素列挙完了: 総数={element_count + 1}, 出力={yielded_count}")
-            
-        except Exception as e:
-            self.logger.error(f"要素列挙エラー: {e}")
-            raise
+        recorded = []
+        for item in descendants:
+            recorded.append(item)
+            yield item
+        
+        # max_items などで途中で打ち切られた場合はここに到達しない
+        key = (id(anchor), depth)
+        # 同じキーの記録は置き換え、新しいキーで上限に達する場合のみ最も古い記録を破棄
+        self._descendant_cache.pop(key, None)
+        if len(self._descendant_cache) >= _DESCENDANT_CACHE_MAXSIZE:
+            del self._descendant_cache[next(iter(self._descendant_cache))]
+        self._descendant_cache[key] = (time.monotonic(), anchor, recorded)
+    
+    def invalidate_cache(self) -> None:
+        """
+        記録した子孫要素を破棄します
+        
+        GUIの内容が変化したことが分かっている場合に呼び出します。
+        """
+        self._descendant_cache.clear()
     
     def _get_related_elements(self, anchor: Union[WindowSpecification, HwndWrapper]) -> List[HwndWrapper]:
         """
@@ -243,220 +1145,265 @@ class ElementFinder:
         Returns:
             List[HwndWrapper]: 関連要素のリスト
         """
-        related_elements = []
+        # 収集しながらハンドルで重複を除去する（最初に現れた要素を残す）
+        related_elements = [anchor]
+        seen_handles = {_handle_key(anchor)}
+        seen_add = seen_handles.add
+        self.logger.debug("アンカー自身を関連要素に追加")
         
         try:
-            # 1. アンカー自身を含める
-            related_elements.append(anchor)
-            self.logger.debug("アンカー自身を関連要素に追加")
-            
+            parent = anchor.parent()
+        except Exception as e:
+            self.logger.debug(f"親要素の取得失敗: {e}")
+            parent = None
+        
+        if parent:
             # 2. 兄弟要素を取得
             try:
-                parent = anchor.parent()
-                if parent:
-                    siblings = parent.children()
-                    related_elements.extend(siblings)
-                    self.logger.debug(f"兄弟要素 {len(siblings)}件を追加")
+                siblings = parent.children()
+                related_elements.extend(
+                    element for element in siblings
+                    if (handle := _handle_key(element)) not in seen_handles and not seen_add(handle)
+                )
+                self.logger.debug(f"兄弟要素 {len(siblings)}件を追加")
             except Exception as e:
                 self.logger.debug(f"兄弟要素の取得失敗: {e}")
             
-            # 3. 親要素の周辺要素も試行
+            # 3. 親要素の周辺要素も試行（親自身の子要素は手順2で取得済みのため、たどらない）
             try:
-                parent = anchor.parent()
-                if parent:
-                    grandparent = parent.parent()
-                    if grandparent:
-                        parent_siblings = grandparent.children()
-                        for sibling in parent_siblings[:5]:  # 最大5個まで
-                            try:
-                                sibling_children = sibling.children()
-                                related_elements.extend(sibling_children[:3])  # 各兄弟の子要素最大3個
-                            except:
-                                continue
-                        self.logger.debug(f"親の兄弟要素周辺から追加")
+                grandparent = parent.parent()
+                if grandparent:
+                    parent_handle = _handle_key(parent)
+                    for sibling in grandparent.children()[:5]:  # 最大5個まで
+                        if _handle_key(sibling) == parent_handle:
+                            continue
+                        try:
+                            sibling_children = sibling.children()[:3]  # 各兄弟の子要素最大3個
+                        except Exception:
+                            continue
+                        related_elements.extend(
+                            element for element in sibling_children
+                            if (handle := _handle_key(element)) not in seen_handles and not seen_add(handle)
+                        )
+                    self.logger.debug(f"親の兄弟要素周辺から追加")
             except Exception as e:
                 self.logger.debug(f"親要素周辺の取得失敗: {e}")
             
-        except Exception as e:
-            self.logger.debug(f"関連要素取得エラー: {e}")
+        self.logger.debug(f"関連要素取得完了: {len(related_elements)}件（重複除去後）")
+        return related_elements
+    
+    def _iter_descendants(self,
+                          children: List[HwndWrapper],
+                          depth: Optional[int]) -> Generator[tuple[HwndWrapper, int], None, None]:
+        """
+        子孫要素をアンカーからの深度とともに列挙するジェネレータ
+        
+        pywinautoのdescendants()と同じ深さ優先の順序で列挙するため、
+        出力時のツリー表示が崩れません。子要素は親要素を返した後に取得するため、
+        呼び出し元が途中で列挙を打ち切った場合、残りの部分木には問い合わせません。
         
-        # 重複除去（ハンドルベース）
-        unique_elements = []
-        seen_handles = set()
+        Args:
+            children: アンカー直下の子要素
+            depth: 検索深度（Noneの場合は無制限）
+        
+        Yields:
+            tuple: (要素, アンカーからの深度)
+        """
+        stack = [(child, 1) for child in reversed(children)]
+        pop = stack.pop
+        push = stack.extend
         
-        for element in related_elements:
+        while stack:
+            element, element_depth = pop()
+            yield element, element_depth
+            
+            if depth is not None and element_depth >= depth:
+                continue
+            
             try:
-                handle = getattr(element, 'handle', id(element))
-                if handle not in seen_handles:
-                    seen_handles.add(handle)
-                    unique_elements.append(element)
-            except:
-                # ハンドル取得に失敗した場合はスキップ
+                grandchildren = element.children()
+            except Exception as e:
+                if self._debug:
+                    self.logger.debug(f"children()取得失敗: {e}")
                 continue
-        
-        self.logger.debug(f"関連要素取得完了: {len(unique_elements)}件（重複除去後）")
-        return unique_elements
+            
+            push((child, element_depth + 1) for child in reversed(grandchildren))
     
-    def _calculate_fast_depth(self, element: HwndWrapper, index: int) -> int:
+    def _extract_uia(self,
+                     element: HwndWrapper,
+                     index: int,
+                     depth: int,
+                     state: Optional[tuple[Optional[bool], Optional[bool]]] = None) -> ElementInfo:
         """
-        高速な深度計算（概算）
+        単一要素から情報を抽出します（UIAバックエンド用）
         
         Args:
-            element: 対象要素
-            index: 要素のインデックス
+            element: pywinauto要素
+            index: インデックス番号
+            depth: 深度
+            state: 取得済みの(可視性, 有効性)（Noneの場合は要素から取得）
         
         Returns:
-            int: 推定深度
-        """
-        # インデックスベースの簡易深度計算
-        # 最初の数個は直下の子要素、後の要素はより深い可能性が高い
-        if index < 5:
-            return 1  # 直下の子要素
-        elif index < 20:
-            return 2  # 2階層目
-        elif index < 50:
-            return 3  # 3階層目
-        else:
-            return 4  # 4階層目以降
+            ElementInfo: 要素情報
+        """
+        try:
+            # 基本情報の取得（複数のテキスト情報を試行）
+            name = self._extract_element_text(element, _UIA_TEXT_PROPERTIES)
+            
+            # UIA固有の情報
+            auto_id = self._safe_get_property(element, 'automation_id', None)
+            control_type = self._safe_get_property(element, 'control_type', None, is_method=True)
+            
+            return self._build_element_info(element, index, depth, name, auto_id, control_type, state)
+            
+        except Exception as e:
+            return self._build_failed_element_info(index, depth, e)
     
-    def _extract_element_info(self, 
-                             element: HwndWrapper, 
-                             index: int, 
-                             depth: int) -> ElementInfo:
+    def _extract_win32(self,
+                       element: HwndWrapper,
+                       index: int,
+                       depth: int,
+                       state: Optional[tuple[Optional[bool], Optional[bool]]] = None) -> ElementInfo:
         """
-        単一要素から情報を抽出します
+        単一要素から情報を抽出します（Win32バックエンド用、UIA固有の情報は取得しない）
         
         Args:
             element: pywinauto要素
             index: インデックス番号
             depth: 深度
+            state: 取得済みの(可視性, 有効性)（Noneの場合は要素から取得）
         
         Returns:
             ElementInfo: 要素情報
         """
         try:
             # 基本情報の取得（複数のテキスト情報を試行）
-            name = self._extract_element_text(element)
-            title = name  # titleとnameは通常同じ
-            
-            # UIA固有の情報
-            if self.backend == 'uia':
-                auto_id = self._safe_get_property(element, 'automation_id', None)
-                control_type = self._safe_get_property(element, 'control_type', None, is_method=True)
-            else:
-                auto_id = None
-                control_type = None
-            
-            # 共通情報
-            class_name = self._safe_get_property(element, 'class_name', None, is_method=True)
-            
-            # 矩形情報
-            rectangle = None
-            try:
-                rect = element.rectangle()
-                if rect:
-                    rectangle = [rect.left, rect.top, rect.right, rect.bottom]
-            except:
-                pass
-            
-            # 状態情報
-            visible = self._safe_get_property(element, 'is_visible', None, is_method=True)
-            enabled = self._safe_get_property(element, 'is_enabled', None, is_method=True)
-            
-            # パス情報の生成
-            path = self._generate_element_path(element, depth)
-            
-            return ElementInfo(
-                index=index,
-                depth=depth,
-                name=name,
-                title=title,
-                auto_id=auto_id,
-                control_type=control_type,
-                class_name=class_name,
-                rectangle=rectangle,
-                visible=visible,
-                enabled=enabled,
-                path=path
-            )
+            name = self._extract_element_text(element, ())
             
+            return self._build_element_info(element, index, depth, name, None, None, state)
+        
         except Exception as e:
-            self.logger.debug(f"要素情報抽出エラー: {e}")
-            # エラー時はデフォルト情報を返す
-            return ElementInfo(
-                index=index,
-                depth=depth,
-                name=f"<取得失敗: {type(e).__name__}>",
-            )
+            return self._build_failed_element_info(index, depth, e)
+    
+    def _build_element_info(self,
+                            element: HwndWrapper,
+                            index: int,
+                            depth: int,
+                            name: str,
+                            auto_id: Optional[str],
+                            control_type: Optional[str],
+                            state: Optional[tuple[Optional[bool], Optional[bool]]] = None) -> ElementInfo:
+        """
+        バックエンド共通の情報を取得して要素情報を作成します
+        
+        Args:
+            element: pywinauto要素
+            index: インデックス番号
+            depth: 深度
+            name: 抽出済みのテキスト
+            auto_id: オートメーションID（UIAのみ）
+            control_type: コントロールタイプ（UIAのみ）
+            state: 取得済みの(可視性, 有効性)（Noneの場合は要素から取得）
+        
+        Returns:
+            ElementInfo: 要素情報
+        """
+        # 共通情報（クラス名とコントロールタイプは種類が少ないため共有の文字列にする）
+        class_name = _intern(self._safe_get_property(element, 'class_name', None, is_method=True))
+        control_type = _intern(control_type)
+        
+        # 矩形情報
+        rectangle = None
+        try:
+            rect = element.rectangle()
+            if rect:
+                rectangle = (rect.left, rect.top, rect.right, rect.bottom)
+        except Exception:
+            pass
+        
+        # 状態情報（可視判定で取得済みの場合は再取得しない）
+        if state is None:
+            state = self._read_state(element, False)
+        visible, enabled = state
+        
+        # パス情報の生成
+        path = self._generate_element_path(class_name, control_type, depth)
+        
+        return self._acquire(
+            index=index,
+            depth=depth,
+            name=name,
+            auto_id=auto_id,
+            control_type=control_type,
+            class_name=class_name,
+            rectangle=rectangle,
+            visible=visible,
+            enabled=enabled,
+            path=path
+        )
+    
+    def _build_failed_element_info(self, index: int, depth: int, error: Exception) -> ElementInfo:
+        """
+        情報抽出に失敗した要素のデフォルト情報を作成します
+        
+        Args:
+            index: インデックス番号
+            depth: 深度
+            error: 発生した例外
+        
+        Returns:
+            ElementInfo: 要素情報
+        """
+        if self._debug:
+            self.logger.debug(f"要素情報抽出エラー: {error}")
+        return self._acquire(
+            index=index,
+            depth=depth,
+            name=f"<取得失敗: {type(error).__name__}>",
+        )
     
-    def _extract_element_text(self, element: HwndWrapper) -> str:
+    def _extract_element_text(self, element: HwndWrapper, text_properties: tuple[str, ...]) -> str:
         """
         要素から識別に役立つテキスト情報を抽出します
         
         Args:
             element: pywinauto要素
+            text_properties: window_textの次に試行するプロパティ名（UIA固有のプロパティ）
             
         Returns:
             str: 抽出されたテキスト（空文字列の場合もあり）
         """
-        # 複数のテキスト取得方法を試行
-        text_candidates = []
-        
+        # 複数のテキスト取得方法を優先順に試行し、最初に得られたテキストを返す
         # 1. window_text (最も一般的)
-        window_text = self._safe_get_property(element, 'window_text', '', is_method=True)
-        if window_text and isinstance(window_text, str) and window_text.strip():
-            text_candidates.append(window_text.strip())
-        
-        # 2. UIA specific properties
-        if self.backend == 'uia':
-            # name property
-            name_prop = self._safe_get_property(element, 'name', '')
-            if name_prop and isinstance(name_prop, str) and name_prop.strip():
-                text_candidates.append(name_prop.strip())
-            
-            # value property (for text controls)
-            value_prop = self._safe_get_property(element, 'value', '')
-            if value_prop and isinstance(value_prop, str) and value_prop.strip():
-                text_candidates.append(value_prop.strip())
-            
-            # help_text property
-            help_text = self._safe_get_property(element, 'help_text', '')
-            if help_text and isinstance(help_text, str) and help_text.strip():
-                text_candidates.append(help_text.strip())
-        
-        # 3. Additional Win32 properties
+        text = _clean_text(self._safe_get_property(element, 'window_text', '', is_method=True))
+        if text:
+            return text
+        
+        # 2. UIA specific properties (name, value, help_text)
+        for property_name in text_properties:
+            text = _clean_text(self._safe_get_property(element, property_name, ''))
+            if text:
+                return text
+        
+        # 3. Additional Win32 properties (texts() method if available)
+        texts = self._safe_get_property(element, 'texts', None, is_method=True)
         try:
-            # texts() method if available
-            if hasattr(element, 'texts'):
-                texts = element.texts()
-                if texts:
-                    for text in texts:
-                        if text and isinstance(text, str) and text.strip():
-                            text_candidates.append(text.strip())
-        except:
+            for candidate in texts or ():
+                text = _clean_text(candidate)
+                if text:
+                    return text
+        except Exception:
             pass
         
         # 4. Try to get text from children for container elements
         try:
-            if not text_candidates:
-                children = element.children()
-                for child in children[:3]:  # 最大3個の子要素まで
-                    child_text = self._safe_get_property(child, 'window_text', '', is_method=True)
-                    if child_text and isinstance(child_text, str) and child_text.strip():
-                        text_candidates.append(f"[{child_text.strip()}]")
-        except:
+            for child in element.children()[:3]:  # 最大3個の子要素まで
+                child_text = _clean_text(self._safe_get_property(child, 'window_text', '', is_method=True))
+                if child_text:
+                    return _shorten_text(f"[{child_text}]")
+        except Exception:
             pass
         
-        # 最適なテキストを選択
-        if text_candidates:
-            # 空でない最初のテキストを返す
-            for text in text_candidates:
-                if text and len(text.strip()) > 0:
-                    # 長すぎるテキストは切り詰め
-                    if len(text) > 50:
-                        return text[:47] + "..."
-                    return text
-        
         return ""
     
     def _safe_get_property(self, 
@@ -476,133 +1423,75 @@ class ElementFinder:
         Returns:
             プロパティ値またはデフォルト値
         """
-        try:
-            if hasattr(element, property_name):
-                prop = getattr(element, property_name)
-                if is_method:
-                    return prop()
-                else:
-                    return prop
-            return default
-        except:
+        kind = self._get_property_schema(element).get(property_name)
+        if kind == 'missing':
             return default
-    
-    def _calculate_depth(self, 
-                        element: HwndWrapper, 
-                        anchor: Union[WindowSpecification, HwndWrapper]) -> int:
-        """
-        要素の深度を計算します（簡易版）
         
-        Args:
-            element: 対象要素
-            anchor: アンカー要素
+        # 型から種別が分かる場合は、メソッドかどうかを型の定義に従って判定する
+        if kind is not None:
+            is_method = kind == 'method'
         
-        Returns:
-            int: 深度
-        """
-        # 簡易的な深度計算（正確ではないが目安として）
         try:
-            # 親をたどって深度を計算
-            depth = 0
-            current = element
-            
-            # 最大10階層まで（無限ループ防止）
-            for _ in range(10):
-                try:
-                    parent = current.parent()
-                    if parent and parent != current:
-                        depth += 1
-                        current = parent
-                    else:
-                        break
-                except:
-                    break
-            
-            return max(1, depth)  # 最低1
-            
-        except:
-            return 1  # エラー時はデフォルト
+            prop = getattr(element, property_name)
+            return prop() if is_method else prop
+        except Exception:
+            return default
     
-    def _calculate_relative_depth(self, 
-                                 element: HwndWrapper, 
-                                 anchor: Union[WindowSpecification, HwndWrapper]) -> int:
+    def _get_property_schema(self, element: Any) -> Dict[str, str]:
         """
-        アンカーからの相対深度を計算します
+        要素の型ごとに、取得するプロパティの種別を取得します（型ごとに一度だけ判定）
         
         Args:
-            element: 対象要素
-            anchor: アンカー要素
+            element: 要素
         
         Returns:
-            int: アンカーからの相対深度（1から開始）
+            Dict[str, str]: プロパティ名から種別（'method', 'attribute', 'missing'）への辞書。
+            型に定義がなく、インスタンス属性や __getattr__（WindowSpecificationなど）で
+            提供され得る名前は含まない
         """
-        try:
-            # アンカーと要素が同じ場合は0
-            if element == anchor:
-                return 0
-            
-            # 要素から親をたどってアンカーまでの距離を計算
-            depth = 0
-            current = element
-            
-            # 最大20階層まで（無限ループ防止）
-            for _ in range(20):
-                try:
-                    parent = current.parent()
-                    if parent is None or parent == current:
-                        break
-                    
-                    depth += 1
-                    
-                    # アンカーに到達した場合
-                    if parent == anchor:
-                        return depth
-                    
-                    # アンカーとハンドルが同じかチェック
-                    try:
-                        if (hasattr(parent, 'handle') and hasattr(anchor, 'handle') and 
-                            parent.handle == anchor.handle):
-                            return depth
-                    except:
-                        pass
-                    
-                    current = parent
-                    
-                except Exception as e:
-                    self.logger.debug(f"親要素取得エラー: {e}")
-                    break
-            
-            # アンカーに到達できなかった場合は、簡易的な深度を返す
-            # 1以上を返す（子要素であることを示す）
-            return max(1, min(depth, 10))
-            
-        except Exception as e:
-            self.logger.debug(f"相対深度計算エラー: {e}")
-            return 1  # エラー時はデフォルト
+        element_type = type(element)
+        schema = self._property_schema.get(element_type)
+        if schema is not None:
+            return schema
+        
+        with self._property_schema_lock:
+            schema = self._property_schema.get(element_type)
+            if schema is not None:
+                return schema
+            schema = {}
+            dynamic = hasattr(element_type, '__getattr__')
+            for name in _PROBED_PROPERTIES:
+                class_attr = getattr(element_type, name, None)
+                if isinstance(class_attr, property):
+                    schema[name] = 'attribute'
+                elif callable(class_attr):
+                    schema[name] = 'method'
+                elif class_attr is None and not dynamic and not hasattr(element, name):
+                    # インスタンス属性として持つ型は種別を決めず、都度取得する
+                    schema[name] = 'missing'
+            self._property_schema[element_type] = schema
+            return schema
     
-    def _generate_element_path(self, element: HwndWrapper, depth: int) -> str:
+    def _generate_element_path(self,
+                               class_name: Optional[str],
+                               control_type: Optional[str],
+                               depth: int) -> str:
         """
         要素のパス情報を生成します
         
         Args:
-            element: 要素
+            class_name: 取得済みのクラス名
+            control_type: 取得済みのコントロールタイプ
             depth: 深度
         
         Returns:
             str: パス文字列
         """
         try:
-            # 簡易的なパス生成
-            class_name = self._safe_get_property(element, 'class_name', 'Unknown')
-            control_type = self._safe_get_property(element, 'control_type', None)
-            
-            if control_type:
-                return f"{control_type}[{depth}]"
-            else:
-                return f"{class_name}[{depth}]"
-                
-        except:
-            return f"Element[{depth}]"
+            return _element_path(class_name, control_type, depth)
+        except TypeError:
+            # ハッシュできない値の場合はキャッシュを使わずに生成
+            return _element_path.__wrapped__(class_name, control_type, depth)
     
     def _is_same_element(self, element1: Any, element2: Any) -> bool:
         """
@@ -661,6 +1550,31 @@ class ElementFinder:
         
         return True
     
+    def _read_state(self,
+                    element: HwndWrapper,
+                    only_visible: bool) -> Optional[tuple[Optional[bool], Optional[bool]]]:
+        """
+        要素の可視性と有効性を取得し、可視要素のみの条件を満たすかを判定します
+        
+        _should_include_element と同じく、取得できなかった状態は除外の理由としません。
+        取得した値は要素情報の作成にそのまま渡し、同じプロパティを二度読まないようにします。
+        
+        Args:
+            element: pywinauto要素
+            only_visible: 可視要素のみフラグ
+        
+        Returns:
+            Optional[tuple[Optional[bool], Optional[bool]]]: (可視性, 有効性)、
+                可視要素のみの指定で非表示または無効と判明した場合None
+        """
+        visible = self._safe_get_property(element, 'is_visible', None, is_method=True)
+        if only_visible and visible is False:
+            return None
+        enabled = self._safe_get_property(element, 'is_enabled', None, is_method=True)
+        if only_visible and enabled is False:
+            return None
+        return visible, enabled
+    
     def _build_filter_description(self, only_visible: bool, max_items: Optional[int]) -> str:
         """
         フィルタ条件の説明文を生成します
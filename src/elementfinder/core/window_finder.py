@@ -4,13 +4,21 @@ ElementFinder ウィンドウ特定機能
 pywinautoを使用してウィンドウを特定し、適切なバックエンドでアクセス可能にします。
 """
 
+import functools
+import logging
+import random
 import re
 import time
-from typing import Optional, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Optional, Any, Generator, Union
 
 import pywinauto
+from pywinauto import Desktop, findwindows, timings
 from pywinauto.application import WindowSpecification
 
+from ..utils.com import co_initialize
 from ..utils.exceptions import (
     WindowNotFoundError, BackendError, PywinautoError, TimeoutError,
     handle_pywinauto_exception
@@ -18,6 +26,40 @@ from ..utils.exceptions import (
 from ..utils.logging import get_logger, log_function_call, log_performance
 
 
+# ウィンドウ検索のリトライ間隔（秒）: 初回は短く、失敗が続くごとに倍にして上限で頭打ち
+_RETRY_INITIAL_DELAY = 0.02
+_RETRY_MAX_DELAY = 0.5
+
+# list_all_windows でウィンドウ情報を並行して取得するワーカー数の上限
+_LIST_WINDOWS_MAX_WORKERS = 16
+
+# ウィンドウ検索で再試行する例外（ウィンドウの出現待ちやCOMの一時的な失敗）
+# これ以外の例外は待っても解消しないため、再試行せずに送出する
+try:
+    from _ctypes import COMError
+    _RETRYABLE = (findwindows.ElementNotFoundError, timings.TimeoutError, COMError)
+except ImportError:
+    # COMErrorはWindowsのみ
+    _RETRYABLE = (findwindows.ElementNotFoundError, timings.TimeoutError)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_title_pattern(title_pattern: str) -> re.Pattern:
+    """
+    タイトルの正規表現パターンをコンパイルします（同じパターンは一度だけコンパイル）
+    
+    Args:
+        title_pattern: タイトルの正規表現パターン
+    
+    Returns:
+        re.Pattern: コンパイル済みのパターン
+    
+    Raises:
+        re.error: パターンが不正な場合
+    """
+    return re.compile(title_pattern)
+
+
 class WindowFinder:
     """
     ウィンドウの特定とアクセスを担当するクラス
@@ -31,13 +73,16 @@ class WindowFinder:
         self.backend = backend
         self.logger = get_logger()
         
-        # バックエンドの初期化チェック
-        self._validate_backend()
+        # バックエンドの初期化チェック（作成したDesktopは検索のたびに再利用する）
+        self._desktop = self._validate_backend()
     
-    def _validate_backend(self) -> None:
+    def _validate_backend(self) -> Desktop:
         """
         指定されたバックエンドが使用可能かチェックします
         
+        Returns:
+            Desktop: 指定されたバックエンドで作成したDesktop
+        
         Raises:
             BackendError: バックエンドが使用できない場合
         """
@@ -48,9 +93,9 @@ class WindowFinder:
                 self.logger.debug(f"UIAバックエンド使用可能: comtypes {comtypes.__version__}")
             
             # pywinautoでのバックエンド設定テスト（Desktopを使用）
-            from pywinauto import Desktop
-            test_desktop = Desktop(backend=self.backend)
+            desktop = Desktop(backend=self.backend)
             self.logger.debug(f"バックエンド '{self.backend}' の初期化に成功")
+            return desktop
             
         except ImportError as e:
             if self.backend == 'uia':
@@ -84,7 +129,7 @@ class WindowFinder:
             WindowNotFoundError: ウィンドウが見つからない場合
             BackendError: バックエンド操作エラー
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             self.logger.info(f"ウィンドウ検索開始: '{window_title}' "
@@ -95,15 +140,17 @@ class WindowFinder:
                 window_title, is_regex, timeout
             )
             
-            duration = time.time() - start_time
-            log_performance("ウィンドウ検索", duration)
-            
-            self.logger.info(f"ウィンドウ検索成功: {self._get_window_info(window)}")
+            # ウィンドウ情報の取得はCOM呼び出しを伴うため、INFOログが出力される場合のみ行う
+            if self.logger.isEnabledFor(logging.INFO):
+                duration = time.perf_counter() - start_time
+                log_performance("ウィンドウ検索", duration)
+                
+                self.logger.info(f"ウィンドウ検索成功: {self._get_window_info(window)}")
             
             return window
             
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             self.logger.error(f"ウィンドウ検索失敗 ({duration:.2f}秒): {e}")
             
             if isinstance(e, (WindowNotFoundError, BackendError)):
@@ -130,30 +177,41 @@ class WindowFinder:
         Raises:
             WindowNotFoundError: タイムアウトまたはウィンドウ未発見
         """
-        end_time = time.time() + timeout
+        # 正規表現はリトライの前に一度だけ検証する（不正なパターンは待たずにエラー）
+        if is_regex:
+            try:
+                title_pattern = _compile_title_pattern(window_title)
+            except re.error as e:
+                raise WindowNotFoundError(window_title, timeout) from e
+        
+        # 壁時計の変更に影響されないよう monotonic で期限を管理
+        deadline = time.monotonic() + timeout
         last_exception = None
         retry_count = 0
         
-        while time.time() < end_time:
+        while time.monotonic() < deadline:
             try:
                 # ウィンドウ検索の実行
                 if is_regex:
-                    window = self._find_window_by_regex(window_title)
+                    window = self._find_window_by_regex(title_pattern)
                 else:
                     window = self._find_window_by_title(window_title)
                 
-                # ウィンドウの存在確認
+                # ウィンドウの存在確認（待機はこのループのバックオフで行う）
                 if self._verify_window_exists(window):
                     return window
                 
-            except Exception as e:
+            except _RETRYABLE as e:
                 last_exception = e
-                retry_count += 1
-                
-                # 短時間待機してリトライ
-                time.sleep(0.5)
-                
-                self.logger.debug(f"ウィンドウ検索リトライ {retry_count}: {e}")
+                self.logger.debug(f"ウィンドウ検索リトライ {retry_count + 1}: {e}")
+            
+            # 指数バックオフ（ゆらぎ付き）で待機してリトライ、期限を超えては待たない
+            delay = min(_RETRY_MAX_DELAY, _RETRY_INITIAL_DELAY * (2 ** retry_count))
+            delay *= random.uniform(0.8, 1.2)
+            retry_count += 1
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                time.sleep(min(delay, remaining))
         
         # タイムアウト
         self.logger.error(f"ウィンドウ検索タイムアウト: {timeout}秒経過")
@@ -172,19 +230,15 @@ class WindowFinder:
         Returns:
             WindowSpecification: ウィンドウ仕様
         """
-        # pywinautoのDesktopを使用してウィンドウを検索
-        from pywinauto import Desktop
-        desktop = Desktop(backend=self.backend)
-        
-        # ウィンドウを検索
-        return desktop.window(title=title)
+        # ウィンドウを検索（Desktopは構築時に作成したものを再利用）
+        return self._desktop.window(title=title)
     
-    def _find_window_by_regex(self, title_pattern: str) -> WindowSpecification:
+    def _find_window_by_regex(self, title_pattern: Union[str, re.Pattern]) -> WindowSpecification:
         """
         正規表現でウィンドウを検索します
         
         Args:
-            title_pattern: タイトルの正規表現パターン
+            title_pattern: タイトルの正規表現パターン（コンパイル済みも可）
         
         Returns:
             WindowSpecification: ウィンドウ仕様
@@ -193,20 +247,14 @@ class WindowFinder:
             WindowNotFoundError: マッチするウィンドウが見つからない場合
         """
         try:
-            # 正規表現パターンをコンパイル
-            pattern = re.compile(title_pattern, re.IGNORECASE)
-            
-            # pywinautoのDesktopを使用してウィンドウを検索
-            from pywinauto import Desktop
-            desktop = Desktop(backend=self.backend)
+            # 正規表現パターンをコンパイル（リトライごとに再コンパイルしない）
+            pattern = _compile_title_pattern(title_pattern)
             
-            # 正規表現でウィンドウを検索
-            return desktop.window(title_re=title_pattern)
+            # 正規表現でウィンドウを検索（コンパイル済みのパターンはpywinauto内でそのまま使われる）
+            return self._desktop.window(title_re=pattern)
             
         except re.error as e:
-            raise WindowNotFoundError(
-                title_pattern
-            ) from e
+            raise WindowNotFoundError(title_pattern, 0) from e
     
     def _verify_window_exists(self, window: WindowSpecification) -> bool:
         """
@@ -217,16 +265,15 @@ class WindowFinder:
         
         Returns:
             bool: ウィンドウが存在する場合True
+        
+        Raises:
+            Exception: 再試行しても解消しない例外（_RETRYABLE 以外）
         """
         try:
-            # exists()メソッドで存在確認
-            if window.exists(timeout=1):
-                # 追加確認: ウィンドウが応答可能か
-                _ = window.window_text()
-                return True
-            return False
+            # exists()メソッドで存在確認（内部で待機せず、一度だけ確認する）
+            return window.exists(timeout=0)
             
-        except Exception as e:
+        except _RETRYABLE as e:
             self.logger.debug(f"ウィンドウ存在確認失敗: {e}")
             return False
     
@@ -277,33 +324,23 @@ class WindowFinder:
             return f"情報取得失敗: {e}"
     
     @log_function_call
-    def list_all_windows(self) -> list:
+    def list_all_windows(self, max_count: Optional[int] = None) -> list:
         """
         現在のデスクトップの全ウィンドウを列挙します（デバッグ用）
         
+        Args:
+            max_count: 最大取得件数（Noneの場合は全件）
+        
         Returns:
             list: ウィンドウ情報のリスト
         """
         try:
-            windows = []
-            
-            # pywinautoのDesktopを使用してウィンドウ列挙
-            from pywinauto import Desktop
-            desktop = Desktop(backend=self.backend)
-            
-            for window in desktop.windows():
-                try:
-                    window_info = {
-                        'title': window.window_text(),
-                        'class_name': window.class_name(),
-                        'process_id': window.process_id(),
-                        'visible': window.is_visible(),
-                        'enabled': window.is_enabled(),
-                    }
-                    windows.append(window_info)
-                except:
-                    # 個別ウィンドウのエラーは無視
-                    continue
+            windows_iter = self.iter_windows()
+            try:
+                windows = list(islice(windows_iter, max_count))
+            finally:
+                # 打ち切った場合は未着手の取得を取り消す
+                windows_iter.close()
             
             self.logger.debug(f"ウィンドウ一覧取得完了: {len(windows)}件")
             return windows
@@ -312,6 +349,72 @@ class WindowFinder:
             self.logger.warning(f"ウィンドウ一覧取得失敗: {e}")
             return []
     
+    def iter_windows(self) -> Generator[dict, None, None]:
+        """
+        現在のデスクトップのウィンドウ情報を順次返すジェネレータ
+        
+        プロパティの取得はCOM呼び出しの待ち時間が支配的なため、ワーカースレッドで並行して行います。
+        先行して取得する件数をワーカー数の2倍までに抑えるため、途中で打ち切った場合に
+        無駄になる取得も同程度に収まります。
+        
+        Yields:
+            dict: ウィンドウ情報（取得に失敗したウィンドウは含めない）
+        """
+        # 構築時に作成したDesktopを使用してウィンドウ列挙
+        desktop_windows = self._desktop.windows()
+        if not desktop_windows:
+            return
+        
+        max_workers = min(_LIST_WINDOWS_MAX_WORKERS, len(desktop_windows))
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='elementfinder-windows',
+            initializer=co_initialize
+        )
+        limit = max_workers * 2
+        pending = deque()
+        
+        try:
+            for window in desktop_windows:
+                pending.append(executor.submit(self._snapshot_window, window))
+                if len(pending) >= limit:
+                    window_info = pending.popleft().result()
+                    if window_info is not None:
+                        yield window_info
+            
+            while pending:
+                window_info = pending.popleft().result()
+                if window_info is not None:
+                    yield window_info
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+    
+    def _snapshot_window(self, window: Any) -> Optional[dict]:
+        """
+        ウィンドウ一覧用の情報を取得します
+        
+        Args:
+            window: pywinautoのウィンドウ要素
+        
+        Returns:
+            Optional[dict]: ウィンドウ情報、取得に失敗した場合はNone
+        """
+        try:
+            # ラッパーのメソッドを経由せず、element_infoのプロパティを直接読む
+            info = window.element_info
+            return {
+                'title': info.rich_text,
+                'class_name': info.class_name,
+                'process_id': info.process_id,
+                'visible': info.visible,
+                'enabled': info.enabled,
+            }
+        except Exception:
+            # 個別ウィンドウのエラーは無視
+            return None
+    
     def get_backend(self) -> str:
         """
         使用中のバックエンド名を取得します
@@ -4,25 +4,28 @@ ElementFinder メインエントリーポイント
 CLIアプリケーションのメイン実行ロジックを提供します。
 """
 
+import logging
 import sys
 import traceback
 from typing import Dict, Any, Optional
 
-try:
-    import win32gui
-    _WIN32GUI_AVAILABLE = True
-except ImportError:
-    _WIN32GUI_AVAILABLE = False
-
+from . import core
 from .cli.parser import parse_command_line
-from .core.window_finder import create_window_finder
-from .core.element_finder import create_element_finder
-from .core.cursor_handler import create_cursor_handler
 from .output.formatters import create_formatter
-from .utils.exceptions import ElementFinderError, CursorError
+from .utils.exceptions import ElementFinderError, CursorError, AnchorNotFoundError
 from .utils.logging import setup_logging, get_logger
 
 
+# アンカー条件のキー -> pywinautoのchild_windowの引数名（nameもtitleとして扱う）
+_ANCHOR_KEY_MAP = {
+    'control-type': 'control_type',
+    'title': 'title',
+    'name': 'title',
+    'class-name': 'class_name',
+    'auto-id': 'auto_id',
+}
+
+
 class ElementFinderApp:
     """
     ElementFinderアプリケーションのメインクラス
@@ -32,6 +35,8 @@ class ElementFinderApp:
         self.logger = None
         self.args = None
         self._cursor_element = None  # カーソル要素を保持
+        self._cursor_handler = None  # カーソル要素を取得したハンドラ（取得済み情報を再利用）
+        self._anchor = None  # 決定したアンカー（pywinauto native出力で再利用）
     
     def run(self, args: Optional[list] = None) -> int:
         """
@@ -49,7 +54,7 @@ class ElementFinderApp:
             
             # ロギング設定
             self.logger = setup_logging(
-                verbose=self.args['verbose'],
+                verbose=self.args.verbose,
                 use_colors=True
             )
             
@@ -91,6 +96,11 @@ class ElementFinderApp:
                     traceback.print_exc()
             
             return 100  # 予期しない例外の終了コード
+        
+        finally:
+            # カーソル要素の取得・詳細情報の取得に使ったワーカーを終了
+            if self._cursor_handler is not None:
+                self._cursor_handler.close()
     
     def _execute_main_logic(self) -> int:
         """
@@ -100,37 +110,49 @@ class ElementFinderApp:
             int: 終了コード
         """
         # 1. ウィンドウの特定（--cursor指定時はスキップ）
-        if self.args['cursor']:
+        if self.args.cursor:
             self.logger.info("ステップ1: ウィンドウ特定（--cursor指定のためスキップ）")
-            window = None
+            window = window_spec = None
         else:
             self.logger.info("ステップ1: ウィンドウ特定")
-            window_finder = create_window_finder(self.args['backend'])
+            window_finder = core.create_window_finder(self.args.backend)
             
             window = window_finder.find_window(
-                self.args['window_title'],
-                self.args['title_re'],
-                self.args['timeout']
+                self.args.window_title,
+                self.args.title_re,
+                self.args.timeout
             )
         
+            # WindowSpecificationは参照のたびにウィンドウを再検索するため、ラッパーを一度だけ解決して使い回す
+            window_spec = window
+            window = window.wrapper_object()
+        
         # 2. アンカーの決定
         self.logger.info("ステップ2: アンカー決定")
         anchor = self._resolve_anchor(window)
         
+        # pywinauto native出力では print_control_identifiers() を持つ解決前のアンカーを再利用する
+        self._anchor = window_spec if anchor is window else anchor
+        
+        # 条件指定のアンカー（WindowSpecification）も列挙の前に一度だけ解決する
+        wrapper_object = getattr(anchor, 'wrapper_object', None)
+        if wrapper_object is not None:
+            anchor = wrapper_object()
+        
         # 3. 要素の列挙
         self.logger.info("ステップ3: 要素列挙")
-        element_finder = create_element_finder(self.args['backend'])
+        element_finder = core.create_element_finder(self.args.backend)
         
-        elements = element_finder.find_elements(
+        elements = element_finder.find_elements_list(
             anchor,
-            depth=self.args['depth'],
-            only_visible=self.args['only_visible'],
-            max_items=self.args['max_items']
+            depth=self.args.depth,
+            only_visible=self.args.only_visible,
+            max_items=self.args.max_items
         )
         
         # 4. カーソル要素の詳細情報取得（--cursorモード時）
         cursor_detailed_info = None
-        if self.args['cursor'] and hasattr(self, '_cursor_element') and self._cursor_element:
+        if self.args.cursor and hasattr(self, '_cursor_element') and self._cursor_element:
             self.logger.info("ステップ4: カーソル要素の詳細情報取得")
             cursor_detailed_info = self._get_cursor_detailed_info(self._cursor_element)
         
@@ -139,7 +161,7 @@ class ElementFinderApp:
         self._output_results(elements, cursor_detailed_info)
         
         # 6. クリーンアップ
-        if not self.args['cursor']:
+        if not self.args.cursor:
             window_finder.close()
 
         return 0
@@ -155,11 +177,11 @@ class ElementFinderApp:
             アンカー要素
         """
         # カーソル指定の場合
-        if self.args['cursor']:
+        if self.args.cursor:
             return self._resolve_cursor_anchor(window)
         
         # アンカー条件指定の場合
-        if self.args['anchor_conditions']:
+        if self.args.anchor_conditions:
             return self._resolve_condition_anchor(window)
         
         # 指定なしの場合はウィンドウ自身
@@ -180,11 +202,13 @@ class ElementFinderApp:
             CursorError: カーソル位置の取得に失敗した場合
         """
         try:
-            cursor_handler = create_cursor_handler(self.args['backend'])
+            cursor_handler = core.create_cursor_handler(self.args.backend)
+            self._cursor_handler = cursor_handler
             
             # カーソル下の要素を取得（アンカー昇格は行わない）
             element = cursor_handler.get_cursor_element(
-                delay=self.args['cursor_delay'],
+                delay=self.args.cursor_delay,
+                strict_delay=self.args.cursor_delay_strict,
                 target_window=None  # アンカー昇格を無効化
             )
             
@@ -194,7 +218,7 @@ class ElementFinderApp:
             self._cursor_element = element
             
             # --parentオプションが指定されている場合
-            if self.args.get('parent', False):
+            if self.args.parent:
                 self.logger.info("--parentオプションが指定されています。親要素を取得します")
                 parent_element = cursor_handler.get_parent_element(element)
                 
@@ -220,44 +244,45 @@ class ElementFinderApp:
         条件指定のアンカーを解決します
         
         Args:
-            window: 対象ウィンドウ
+            window: 対象ウィンドウ（WindowSpecification または解決済みのラッパー）
         
         Returns:
-            アンカー要素
+            アンカー要素（WindowSpecification）
         """
-        conditions = self.args['anchor_conditions']
-        found_index = self.args['anchor_found_index']
+        conditions = self.args.anchor_conditions
+        found_index = self.args.anchor_found_index
         
-        self.logger.debug(f"アンカー条件: {conditions}, インデックス: {found_index}")
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            self.logger.debug(f"アンカー条件: {conditions}, インデックス: {found_index}")
         
         try:
             # pywinautoのchild_windowを使用
             # 条件を適切にマッピング
-            kwargs = {}
-            
-            for key, value in conditions.items():
-                if key == 'control-type':
-                    kwargs['control_type'] = value
-                elif key == 'title':
-                    kwargs['title'] = value
-                elif key == 'name':
-                    kwargs['title'] = value  # nameもtitleとして扱う
-                elif key == 'class-name':
-                    kwargs['class_name'] = value
-                elif key == 'auto-id':
-                    kwargs['auto_id'] = value
+            kwargs = {
+                _ANCHOR_KEY_MAP[key]: value
+                for key, value in conditions.items()
+                if key in _ANCHOR_KEY_MAP
+            }
             
             # found_indexを指定
             kwargs['found_index'] = found_index
             
-            anchor = window.child_window(**kwargs)
+            if hasattr(window, 'child_window'):
+                anchor = window.child_window(**kwargs)
+            else:
+                # 解決済みのラッパーの配下を検索（child_windowと同じ条件でウィンドウの再検索を省く）
+                from pywinauto import Desktop
+                anchor = Desktop(backend=self.args.backend).window(
+                    parent=window.element_info, top_level_only=False, **kwargs
+                )
             
             # 存在確認
             if not anchor.exists():
-                from .utils.exceptions import AnchorNotFoundError
                 raise AnchorNotFoundError(conditions, found_index)
             
-            self.logger.debug(f"アンカー解決成功: {kwargs}")
+            if debug_enabled:
+                self.logger.debug(f"アンカー解決成功: {kwargs}")
             return anchor
             
         except Exception as e:
@@ -275,12 +300,16 @@ class ElementFinderApp:
             Optional[Dict[str, Any]]: 詳細情報、取得できない場合はNone
         """
         try:
-            cursor_handler = create_cursor_handler(self.args['backend'])
+            # カーソル要素を取得したハンドラを再利用（Desktopや取得済みの矩形を共有）
+            if self._cursor_handler is None:
+                self._cursor_handler = core.create_cursor_handler(self.args.backend)
+            cursor_handler = self._cursor_handler
             
-            # カーソル位置を取得
-            if _WIN32GUI_AVAILABLE:
+            # カーソル位置を取得（win32guiは必要になった時点でインポート）
+            try:
+                import win32gui
                 cursor_pos = win32gui.GetCursorPos()
-            else:
+            except ImportError:
                 # フォールバック: 要素の矩形の中心を使用
                 try:
                     rect = cursor_element.rectangle()
@@ -310,13 +339,13 @@ class ElementFinderApp:
         try:
 
             
-            if self.args['json']:
+            if self.args.json:
                 # JSON出力
-                formatter = create_formatter('json', fields=self.args['fields'])
+                formatter = create_formatter('json', fields=self.args.fields)
                 output = formatter.format_elements(elements)
-            elif self.args['pywinauto_native']:
+            elif self.args.pywinauto_native:
                 # pywinauto native出力
-                formatter = create_formatter('pywinauto-native', depth=self.args['depth'])
+                formatter = create_formatter('pywinauto-native', depth=self.args.depth)
                 # pywinauto nativeの場合、元のwindow要素を渡す必要がある
                 output = self._format_pywinauto_native(formatter, elements)
             else:
@@ -324,7 +353,7 @@ class ElementFinderApp:
                 formatter = create_formatter(
                     'pywinauto',
                     show_alternative_ids=True,
-                    show_rectangle=self.args['show_rectangle']  # show_rectangleオプション
+                    show_rectangle=self.args.show_rectangle  # show_rectangleオプション
                 )
                 output = formatter.format_elements(elements)
             
@@ -484,18 +513,22 @@ class ElementFinderApp:
         Returns:
             pywinauto要素
         """
+        # メイン処理で決定済みのアンカーを再利用（ウィンドウの再検索を省く）
+        if self._anchor is not None:
+            return self._anchor
+        
         # --cursor指定時は直接アンカーを解決
-        if self.args['cursor']:
+        if self.args.cursor:
             return self._resolve_anchor(None)
         
         # ウィンドウの特定（メインロジックと同じ）
-        window_finder = create_window_finder(self.args['backend'])
+        window_finder = core.create_window_finder(self.args.backend)
         
         try:
             window = window_finder.find_window(
-                self.args['window_title'],
-                self.args['title_re'],
-                self.args['timeout']
+                self.args.window_title,
+                self.args.title_re,
+                self.args.timeout
             )
             
             # アンカーの決定（メインロジックと同じ）
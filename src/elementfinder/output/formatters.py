@@ -4,15 +4,19 @@ ElementFinder 出力フォーマッタ
 要素情報を人間が読みやすい形式やJSON形式に変換する機能を提供します。
 """
 
+from __future__ import annotations
+
 import json
 import io
 import sys
 from contextlib import redirect_stdout
-from typing import List, Dict, Any, Optional, Union
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union
 
-from ..core.element_finder import ElementInfo
 from ..utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from ..core.element_finder import ElementInfo
+
 
 
 
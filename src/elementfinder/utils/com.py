@@ -0,0 +1,18 @@
+"""
+ElementFinder COM関連ユーティリティ
+
+ワーカースレッドでCOMを使用するための共通処理を提供します。
+"""
+
+
+def co_initialize() -> None:
+    """
+    ワーカースレッドでCOMを初期化します（ThreadPoolExecutorのinitializer用）
+    
+    pywin32が利用できない環境では何もしません。
+    """
+    try:
+        import pythoncom
+        pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+    except ImportError:
+        pass
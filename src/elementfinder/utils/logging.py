@@ -5,6 +5,7 @@ ElementFinder ロギング設定
 --verboseオプションの有無により、ログレベルを動的に制御します。
 """
 
+import functools
 import logging
 import sys
 from typing import Optional
@@ -59,6 +60,10 @@ class ElementFinderFormatter(logging.Formatter):
         return message
 
 
+# setup_logging で最後に構成した設定（verbose, log_file, use_colors）
+_configured_with: Optional[tuple] = None
+
+
 def setup_logging(verbose: bool = False, 
                  log_file: Optional[str] = None,
                  use_colors: bool = True) -> logging.Logger:
@@ -74,10 +79,19 @@ def setup_logging(verbose: bool = False,
         設定済みのロガーインスタンス
     """
     
+    global _configured_with
+    
     # ロガーの取得
     logger = logging.getLogger('elementfinder')
     
-    # 既存のハンドラをクリア（重複防止）
+    # 同じ設定で構成済みの場合はハンドラを作り直さない（run() を繰り返し呼び出す場合など）
+    config = (verbose, log_file, use_colors)
+    if config == _configured_with and logger.handlers:
+        return logger
+    
+    # 既存のハンドラを閉じてからクリア（重複防止）
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
     
     # ログレベルの設定
@@ -113,6 +127,7 @@ def setup_logging(verbose: bool = False,
     # 上位ロガーへの伝播を無効化
     logger.propagate = False
     
+    _configured_with = config
     return logger
 
 
@@ -137,6 +152,7 @@ def log_function_call(func):
     関数呼び出しをログ出力するデコレータ
     
     デバッグ時に関数の実行開始・終了をトレースするために使用します。
+    DEBUGログが無効な場合は、引数の文字列化などを行わずにそのまま関数を呼び出します。
     
     Usage:
         @log_function_call
@@ -144,9 +160,14 @@ def log_function_call(func):
             # 処理
             return result
     """
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         logger = get_logger()
         
+        # 引数の文字列化はpywinauto要素のプロパティ取得を伴うことがあるため、出力されない場合は省く
+        if not logger.isEnabledFor(logging.DEBUG):
+            return func(*args, **kwargs)
+        
         # 引数の文字列化（長すぎる場合は省略）
         args_str = ', '.join([str(arg)[:50] + '...' if len(str(arg)) > 50 
                              else str(arg) for arg in args])
@@ -185,6 +206,8 @@ def log_performance(operation: str, duration: float, count: Optional[int] = None
         count: 処理件数（オプション）
     """
     logger = get_logger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     if count is not None:
         rate = count / duration if duration > 0 else 0
@@ -0,0 +1,10 @@
+"""
+テスト共通設定
+
+src レイアウトのパッケージをインストールせずにインポートできるようにします。
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
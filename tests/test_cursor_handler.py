@@ -0,0 +1,70 @@
+"""
+CursorHandler のテスト
+"""
+
+import sys
+import threading
+import types
+
+from elementfinder.core.cursor_handler import CursorHandler
+
+
+class _FakeWalker:
+    """親子関係を辞書で表すControlViewWalkerの代替"""
+    
+    def __init__(self, parents):
+        self.parents = parents
+        self.calls = 0
+    
+    def GetParentElement(self, element):
+        self.calls += 1
+        return self.parents.get(element)
+
+
+def _install_iuia(monkeypatch, walker):
+    """ControlViewWalkerだけを持つIUIAを pywinauto.uia_defines として登録します"""
+    iuia = types.SimpleNamespace(ControlViewWalker=walker)
+    uia_defines = types.ModuleType('pywinauto.uia_defines')
+    uia_defines.IUIA = lambda: types.SimpleNamespace(iuia=iuia)
+    pywinauto = sys.modules.get('pywinauto') or types.ModuleType('pywinauto')
+    monkeypatch.setitem(sys.modules, 'pywinauto', pywinauto)
+    monkeypatch.setitem(sys.modules, 'pywinauto.uia_defines', uia_defines)
+
+
+def _uia_element(raw):
+    return types.SimpleNamespace(element_info=types.SimpleNamespace(element=raw))
+
+
+def test_calculate_uia_depth_uses_control_view_walker(monkeypatch):
+    # button -> pane -> window -> desktop -> (None)
+    walker = _FakeWalker({'button': 'pane', 'pane': 'window', 'window': 'desktop'})
+    _install_iuia(monkeypatch, walker)
+    
+    handler = CursorHandler('uia')
+    
+    assert handler._calculate_uia_depth(_uia_element('button')) == 3
+    assert walker.calls == 4
+
+
+def test_calculate_element_depth_skips_parent_walk(monkeypatch):
+    _install_iuia(monkeypatch, _FakeWalker({'button': 'window', 'window': 'desktop'}))
+    element = _uia_element('button')
+    element.parent = lambda: (_ for _ in ()).throw(AssertionError('parent() should not be called'))
+    
+    assert CursorHandler('uia')._calculate_element_depth(element) == 2
+
+
+def test_calculate_uia_depth_without_raw_element():
+    assert CursorHandler('uia')._calculate_uia_depth(object()) is None
+
+
+def test_close_shuts_down_worker():
+    handler = CursorHandler('uia')
+    executor = handler._get_executor()
+    executor.submit(lambda: None).result()
+    
+    handler.close()
+    
+    assert handler._executor is None
+    assert executor._shutdown
+    assert not any(t.name.startswith('elementfinder-win32') for t in threading.enumerate())
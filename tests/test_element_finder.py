@@ -0,0 +1,80 @@
+"""
+ElementFinder のテスト
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('pywinauto')
+
+from elementfinder.core.element_finder import ElementFinder
+
+
+_TEXT_PATTERN_PROPERTY_ID = 30040
+
+
+class _LiveElement:
+    """UIAWrapperと同じ規則でテキストを返す要素（window_text はTextPatternの本文またはName）"""
+    
+    def __init__(self, name, class_name='Button', document=None, children=()):
+        self._name = name
+        self._class_name = class_name
+        self._document = document
+        self._children = list(children)
+    
+    def window_text(self):
+        if self._class_name and self._document is not None:
+            return self._document
+        return self._name
+    
+    def class_name(self):
+        return self._class_name
+    
+    def is_visible(self):
+        return True
+    
+    def is_enabled(self):
+        return True
+    
+    def rectangle(self):
+        return SimpleNamespace(left=0, top=0, right=10, bottom=10)
+    
+    def children(self):
+        return self._children
+
+
+class _CachedElement:
+    """_LiveElement と同じ要素をCacheRequestで取得した場合のIUIAutomationElement"""
+    
+    def __init__(self, live):
+        self.live = live
+        self.CachedName = live._name
+        self.CachedClassName = live._class_name
+        self.CachedAutomationId = ''
+        self.CachedControlType = 50000
+        self.CachedIsOffscreen = False
+        self.CachedIsEnabled = True
+        self.CachedBoundingRectangle = live.rectangle()
+    
+    def GetCachedPropertyValue(self, property_id):
+        assert property_id == _TEXT_PATTERN_PROPERTY_ID
+        return self.live._document is not None
+
+
+@pytest.mark.parametrize('live', [
+    _LiveElement('OK'),
+    _LiveElement('検索', class_name='Edit', document='入力済みの本文'),
+    _LiveElement('', class_name='Pane', children=[_LiveElement('子要素')]),
+    _LiveElement('  ' + 'x' * 80),
+], ids=['named', 'text-pattern', 'unnamed-container', 'long-name'])
+def test_cached_text_matches_live_text(monkeypatch, live):
+    finder = ElementFinder('uia')
+    monkeypatch.setattr(finder, '_wrap_uia_element', lambda raw_element: raw_element.live)
+    
+    live_info = finder._extract_uia(live, 0, 1)
+    cached_info = finder._extract_uia_cached(
+        _CachedElement(live), 1, False, {50000: 'Button'}, _TEXT_PATTERN_PROPERTY_ID
+    )
+    
+    assert cached_info.name == live_info.name
@@ -0,0 +1,32 @@
+"""
+コマンドライン引数解析のテスト
+"""
+
+import pytest
+
+from elementfinder.cli.parser import ElementFinderArgumentParser
+from elementfinder.utils.exceptions import InvalidArgumentError
+
+
+def parse(*args):
+    return ElementFinderArgumentParser().parse_args(list(args))
+
+
+def test_conflicting_anchor_title_and_name_is_rejected():
+    with pytest.raises(InvalidArgumentError) as excinfo:
+        parse('アプリ', '--anchor-title', 'OK', '--anchor-name', 'Cancel')
+    
+    assert excinfo.value.argument_name == 'anchor-name'
+    assert excinfo.value.exit_code == 5
+
+
+def test_same_anchor_title_and_name_is_accepted():
+    args = parse('アプリ', '--anchor-title', 'OK', '--anchor-name', 'OK')
+    
+    assert args.anchor_conditions == {'title': 'OK', 'name': 'OK'}
+
+
+def test_anchor_conditions_are_not_checked_with_cursor():
+    args = parse('--cursor', '--anchor-title', 'OK', '--anchor-name', 'Cancel')
+    
+    assert args.cursor